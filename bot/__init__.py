@@ -6,14 +6,49 @@ Usage::
     bot.run(token)
 """
 
+from __future__ import annotations
+
+import aiohttp
 import discord
 from discord.ext import commands
 
+from memory import flush as flush_conversations
+from memory.custom_contexts import flush as flush_contexts
+from services.http_session import get_session as get_http_session, close_session as close_http_session
+from services.openai_client import close_openai_client
+
+
+class CatBot(commands.Bot):
+    """``commands.Bot`` with startup/shutdown handling for shared resources."""
+
+    http_session: aiohttp.ClientSession | None = None
+
+    async def on_message(self, message: discord.Message) -> None:
+        # Every command (and the chat fallback) needs a leading mention,
+        # so ordinary channel chatter skips command parsing entirely.
+        if message.author.bot or self.user not in message.mentions:
+            return
+        await self.process_commands(message)
+
+    async def close(self) -> None:
+        try:
+            poster = getattr(self, "cat_poster", None)
+            if poster is not None:
+                poster.cancel()
+            flush_conversations()  # don't lose batched conversation writes
+            flush_contexts()
+            await close_http_session()
+            self.http_session = None
+            await close_openai_client()
+        finally:
+            await super().close()
+
+
 # ── Create the Bot instance ──────────────────────────────
 intents = discord.Intents.default()
 intents.message_content = True
 
-bot = commands.Bot(command_prefix=commands.when_mentioned, intents=intents)
+bot = CatBot(command_prefix=commands.when_mentioned, intents=intents)
 
 
 # ── Wire up events and commands on import ────────────────
@@ -31,4 +66,7 @@ async def _load_cogs():
 @bot.event
 async def setup_hook():
     """discord.py 2.x hook — runs before on_ready."""
+    # Open the shared HTTP session up front so the first command
+    # doesn't pay for connector setup.
+    bot.http_session = await get_http_session()
     await _load_cogs()
@@ -1,7 +1,11 @@
 """Command registration — loads all Cog modules."""
 
+import logging
+
 from discord.ext import commands
 
+log = logging.getLogger(__name__)
+
 # Paths are relative to the bot package (dot-separated)
 _COG_MODULES = [
     "bot.commands.cat_content",
@@ -17,6 +21,6 @@ async def register_all(bot: commands.Bot) -> None:
     for module in _COG_MODULES:
         try:
             await bot.load_extension(module)
-            print(f"[INFO] Loaded cog: {module}")
+            log.info("Loaded cog: %s", module)
         except Exception as e:
-            print(f"[ERROR] Failed to load cog {module}: {e}")
+            log.error("Failed to load cog %s: %s", module, e)
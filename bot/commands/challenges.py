@@ -7,6 +7,7 @@ completed their active challenges.
 from __future__ import annotations
 
 import datetime
+import logging
 
 import discord
 from discord.ext import commands, tasks
@@ -25,6 +26,8 @@ from memory.challenges import (
     _format_deadline,
 )
 
+log = logging.getLogger(__name__)
+
 
 def _challenge_embed(c: Challenge, *, show_participants: bool = False) -> discord.Embed:
     """Build a rich embed for a challenge."""
@@ -126,7 +129,7 @@ class ChallengeCog(commands.Cog, name="Challenges"):
                 inline=True,
             )
             await channel.send(content=pings, embed=embed)
-            print(f"[CHALLENGE] Reminded {len(missing)} users for #{c.id} in guild {c.guild_id}")
+            log.info("[CHALLENGE] Reminded %s users for #%s in guild %s", len(missing), c.id, c.guild_id)
 
     @reminder_loop.before_loop
     async def before_reminder(self):
@@ -206,7 +209,7 @@ class ChallengeCog(commands.Cog, name="Challenges"):
             inline=False,
         )
         await ctx.send(embed=embed)
-        print(f"[CMD] @cat challenge create by {ctx.author} — #{c.id} '{title}' ({mode})")
+        log.info("[CMD] @cat challenge create by %s — #%s '%s' (%s)", ctx.author, c.id, title, mode)
 
     async def _describe(self, ctx: commands.Context, rest: str):
         """``@cat challenge describe <id> <description>``"""
@@ -229,7 +232,7 @@ class ChallengeCog(commands.Cog, name="Challenges"):
         c.description = parts[1].strip()[:2000]
         save_challenges()
         await ctx.send(f"*scribbles notes* description updated for challenge #{c.id}! 🐱")
-        print(f"[CMD] @cat challenge describe #{c.id} by {ctx.author}")
+        log.info("[CMD] @cat challenge describe #%s by %s", c.id, ctx.author)
 
     async def _list(self, ctx: commands.Context, rest: str):
         """``@cat challenge list [daily|weekly]``"""
@@ -277,7 +280,7 @@ class ChallengeCog(commands.Cog, name="Challenges"):
                 f"*high-paws* {ctx.author.mention} joined challenge #{c.id} — **{c.title}**! "
                 f"({len(c.participants)} participants now) 🐱🎯"
             )
-            print(f"[CMD] @cat challenge join #{c.id} by {ctx.author}")
+            log.info("[CMD] @cat challenge join #%s by %s", c.id, ctx.author)
         else:
             await ctx.send("*pokes you* you already joined this challenge! 🐱")
 
@@ -314,7 +317,7 @@ class ChallengeCog(commands.Cog, name="Challenges"):
             )
             if done == total and total > 0:
                 await ctx.send(f"🏆 **ALL participants completed challenge #{c.id}!** Amazing work everyone! 🐱👑")
-            print(f"[CMD] @cat challenge done #{c.id} by {ctx.author}")
+            log.info("[CMD] @cat challenge done #%s by %s", c.id, ctx.author)
         elif ctx.author.id not in c.participants:
             await ctx.send(
                 f"*tilts head* you need to join first! use `@cat challenge join {c.id}` 🐱"
@@ -383,7 +386,7 @@ class ChallengeCog(commands.Cog, name="Challenges"):
             embed.add_field(name="Progress", value=f"{done_count}/{total} completed", inline=True)
             await ctx.send(content=pings, embed=embed)
 
-        print(f"[CMD] @cat challenge remind by {ctx.author} — {len(challenges_to_remind)} challenges")
+        log.info("[CMD] @cat challenge remind by %s — %s challenges", ctx.author, len(challenges_to_remind))
 
     async def _delete(self, ctx: commands.Context, rest: str):
         """``@cat challenge delete <id>`` (creator or admin only)"""
@@ -400,7 +403,7 @@ class ChallengeCog(commands.Cog, name="Challenges"):
         guild_id = ctx.guild.id if ctx.guild else ctx.author.id
         delete_challenge(guild_id, c.id)
         await ctx.send(f"*knocks challenge #{c.id} off the table* deleted! 🐱")
-        print(f"[CMD] @cat challenge delete #{c.id} by {ctx.author}")
+        log.info("[CMD] @cat challenge delete #%s by %s", c.id, ctx.author)
 
     async def _end(self, ctx: commands.Context, rest: str):
         """``@cat challenge end <id>`` — deactivate without deleting (creator or admin)."""
@@ -432,7 +435,7 @@ class ChallengeCog(commands.Cog, name="Challenges"):
             if missed:
                 embed.add_field(name="Missed", value="\n".join(missed[:10]), inline=True)
         await ctx.send(embed=embed)
-        print(f"[CMD] @cat challenge end #{c.id} by {ctx.author}")
+        log.info("[CMD] @cat challenge end #%s by %s", c.id, ctx.author)
 
     async def _show_help(self, ctx: commands.Context, rest: str = ""):
         """Show challenge command help."""
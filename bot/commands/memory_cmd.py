@@ -4,13 +4,14 @@ from __future__ import annotations
 
 import datetime
 import io
+import logging
 
 import discord
 from discord.ext import commands
 
 from memory import (
     get_user_memory,
-    save_all as save_conversations,
+    mark_dirty as mark_conversations_dirty,
     get_memory_count,
     get_all_memories,
     delete_user_memories,
@@ -20,6 +21,8 @@ from memory import (
     import_all_conversations,
 )
 
+log = logging.getLogger(__name__)
+
 
 class MemoryCog(commands.Cog, name="Memory"):
     """Commands for viewing and managing the bot's memory about you."""
@@ -30,7 +33,7 @@ class MemoryCog(commands.Cog, name="Memory"):
     @commands.command(name="memory")
     async def cat_memory(self, ctx: commands.Context, *, action: str = None):
         """View, clear, export, or import what the bot remembers about you."""
-        print(f"[CMD] @cat memory triggered by {ctx.author} in #{getattr(ctx.channel, 'name', 'DM')}")
+        log.info("[CMD] @cat memory triggered by %s in #%s", ctx.author, getattr(ctx.channel, 'name', 'DM'))
         user_id = ctx.author.id
         mem = get_user_memory(user_id, ctx.author.display_name)
 
@@ -38,10 +41,10 @@ class MemoryCog(commands.Cog, name="Memory"):
         if action and action.lower() in ("clear", "reset", "forget", "wipe"):
             mem.recent_messages.clear()
             mem.long_term_notes = ""
-            save_conversations()
+            mark_conversations_dirty(user_id)
             deleted = await delete_user_memories(user_id)
             await ctx.send(f"*bonks head on keyboard* poof! i forgot everything about you~ ({deleted} memories erased) fresh start! 🐱")
-            print(f"[CMD] @cat memory cleared for {ctx.author} — {deleted} vector memories deleted")
+            log.info("[CMD] @cat memory cleared for %s — %s vector memories deleted", ctx.author, deleted)
             return
 
         # ── Export (single user — vector memories) ───────
@@ -55,7 +58,7 @@ class MemoryCog(commands.Cog, name="Memory"):
                 filename=f"cat_memory_{ctx.author.name}.json",
             )
             await ctx.send("*carefully packs memories into a box* here you go~ 📦🐱", file=file)
-            print(f"[CMD] @cat memory export completed for {ctx.author}")
+            log.info("[CMD] @cat memory export completed for %s", ctx.author)
             return
 
         # ── Export all (admin only — conversation data) ──
@@ -69,7 +72,7 @@ class MemoryCog(commands.Cog, name="Memory"):
                 filename="cat_memories_all.json",
             )
             await ctx.send("*drops a big box of memories off the table* here's everyone's data~ 📦🐱", file=file)
-            print(f"[CMD] @cat memory export_all completed by {ctx.author}")
+            log.info("[CMD] @cat memory export_all completed by %s", ctx.author)
             return
 
         # ── Import (single user — vector memories) ───────
@@ -94,7 +97,7 @@ class MemoryCog(commands.Cog, name="Memory"):
                 await ctx.send(f"*knocks file off table* import failed: {error} 🐱")
             else:
                 await ctx.send(f"*unpacks memories carefully* done! imported {count} memories~ 🐱")
-                print(f"[CMD] @cat memory import completed for {ctx.author} — {count} memories")
+                log.info("[CMD] @cat memory import completed for %s — %s memories", ctx.author, count)
             return
 
         # ── Import all (admin only — conversation data) ──
@@ -122,7 +125,7 @@ class MemoryCog(commands.Cog, name="Memory"):
                 await ctx.send(f"*knocks file off table* import failed: {error} 🐱")
             else:
                 await ctx.send(f"*unpacks a big box* done! imported memories for {count} users~ 🐱")
-                print(f"[CMD] @cat memory import_all completed by {ctx.author} — {count} users")
+                log.info("[CMD] @cat memory import_all completed by %s — %s users", ctx.author, count)
             return
 
         # ── View (default) ───────────────────────────────
@@ -156,7 +159,7 @@ class MemoryCog(commands.Cog, name="Memory"):
             last = datetime.datetime.fromtimestamp(mem.last_seen, tz=datetime.timezone.utc)
             embed.set_footer(text=f"Last talked: {last.strftime('%Y-%m-%d %H:%M UTC')}")
         await ctx.send(embed=embed)
-        print(f"[CMD] @cat memory displayed for {ctx.author}")
+        log.info("[CMD] @cat memory displayed for %s", ctx.author)
 
 
 async def setup(bot: commands.Bot):
@@ -6,6 +6,8 @@ tunable setting without restarting the bot.
 
 from __future__ import annotations
 
+import logging
+
 import discord
 from discord.ext import commands
 
@@ -18,6 +20,8 @@ from memory.guild_settings import (
     get_default,
 )
 
+log = logging.getLogger(__name__)
+
 
 def _format_value(key: str, value) -> str:
     """Pretty-print a setting value."""
@@ -66,7 +70,7 @@ class SettingsCog(commands.Cog, name="Settings"):
         parts = args.strip().split(None, 2)
         action = parts[0].lower() if parts else "list"
 
-        print(f"[CMD] @cat settings {action} by {ctx.author} in #{ctx.channel.name}")
+        log.info("[CMD] @cat settings %s by %s in #%s", action, ctx.author, ctx.channel.name)
 
         if action in ("list", "show", "view"):
             await self._list(ctx)
@@ -168,7 +172,7 @@ class SettingsCog(commands.Cog, name="Settings"):
         )
         embed.set_footer(text="Changes take effect immediately.")
         await ctx.send(embed=embed)
-        print(f"[SETTINGS] {ctx.author} set {key} = {value!r} in guild {guild_id}")
+        log.info("[SETTINGS] %s set %s = %r in guild %s", ctx.author, key, value, guild_id)
 
     async def _reset(self, ctx: commands.Context, key: str):
         """Reset a setting to its global default."""
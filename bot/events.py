@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import logging
 import re
 
 import discord
@@ -9,21 +10,26 @@ from discord.ext import commands
 
 import config
 from bot.helpers import parse_attachments, send_long_response
-from bot.commands.ai_chat import custom_contexts
 from memory.guild_settings import load_all_settings as load_guild_settings, get as gs_get
+from memory.custom_contexts import get_context, load_contexts
 from memory import (
     get_user_memory,
-    load_all as load_conversations,
-    save_all as save_conversations,
+    load_all_async as load_conversations,
+    mark_dirty as mark_conversations_dirty,
     prune_old_conversations,
     search_memories,
     format_memories_block,
-    extract_and_update_memories,
+    schedule_extract,
     migrate_legacy_notes_to_vector_store,
 )
 from services.openai_chat import ask_cat
 from scheduler import setup_scheduled_tasks
 
+log = logging.getLogger(__name__)
+
+# Inline ``[context: ...]`` override inside a chat message
+_CONTEXT_RE = re.compile(r'\[context:\s*(.+?)\]', re.IGNORECASE | re.DOTALL)
+
 
 def register_events(bot: commands.Bot) -> None:
     """Attach event handlers to *bot*."""
@@ -33,21 +39,31 @@ def register_events(bot: commands.Bot) -> None:
 
     @bot.event
     async def on_ready():
-        load_guild_settings()
-        load_conversations()
-        prune_old_conversations()
-
-        # Migrate legacy flat-text notes into ChromaDB (one-time)
-        try:
-            migrated = await migrate_legacy_notes_to_vector_store()
-            if migrated:
-                print(f"[INFO] Migrated {migrated} legacy memories to vector store")
-        except Exception as e:
-            print(f"[WARNING] Legacy migration failed (non-fatal): {e}")
-
-        print(f"[INFO] Logged in as {bot.user} (ID: {bot.user.id})")
-        print(f"[INFO] Target channel: {config.CAT_CHANNEL_ID}")
-        print("[INFO] Starting scheduled cat poster...")
+        # Bot ID is fixed after login — build the mention strings and matcher once
+        bot._mentions = (f"<@{bot.user.id}>", f"<@!{bot.user.id}>")
+        bot._mention_re = re.compile(rf"<@!?{re.escape(str(bot.user.id))}>")
+
+        # on_ready fires again after every reconnect.  Reloading from disk
+        # then would overwrite in-memory changes whose debounced save is
+        # still pending, so state is loaded only on the first one.
+        if not getattr(bot, "_loaded", False):
+            bot._loaded = True
+            load_guild_settings()
+            await load_conversations()
+            prune_old_conversations()
+            load_contexts()
+
+            # Migrate legacy flat-text notes into ChromaDB (one-time)
+            try:
+                migrated = await migrate_legacy_notes_to_vector_store()
+                if migrated:
+                    log.info("Migrated %s legacy memories to vector store", migrated)
+            except Exception as e:
+                log.warning("Legacy migration failed (non-fatal): %s", e)
+
+        log.info("Logged in as %s (ID: %s)", bot.user, bot.user.id)
+        log.info("Target channel: %s", config.CAT_CHANNEL_ID)
+        log.info("Starting scheduled cat poster...")
 
         if not cat_poster.is_running():
             cat_poster.start()
@@ -65,11 +81,11 @@ def register_events(bot: commands.Bot) -> None:
                 "*stretches and yawns* mrrp~ i'm awake! "
                 "Cat Supremacy Bot is online and ready to serve the feline overlords 🐱👑"
             )
-            print(f"[INFO] Hello message sent to #{channel.name}")
+            log.info("Hello message sent to #%s", channel.name)
         else:
-            print(f"[WARNING] Could not find channel {config.CAT_CHANNEL_ID} to send hello message")
+            log.warning("Could not find channel %s to send hello message", config.CAT_CHANNEL_ID)
 
-        print("[INFO] Cat Supremacy Bot is live! 🐱👑")
+        log.info("Cat Supremacy Bot is live! 🐱👑")
 
     @bot.event
     async def on_command_error(ctx: commands.Context, error):
@@ -82,16 +98,22 @@ def register_events(bot: commands.Bot) -> None:
         if ctx.author.bot:
             return
 
-        message = ctx.message.content
-        for mention in [f"<@{bot.user.id}>", f"<@!{bot.user.id}>"]:
-            message = message.replace(mention, "")
-        question = message.strip()
+        # The mention is almost always a prefix — strip it cheaply and
+        # only fall back to the regex if another mention might remain.
+        content = ctx.message.content
+        for prefix in bot._mentions:
+            if content.startswith(prefix):
+                content = content[len(prefix):]
+                break
+        if "<@" in content:
+            content = bot._mention_re.sub("", content)
+        question = content.strip()
 
         if not question:
             await ctx.send("*stares at you blankly* ...meow? ask me someething! human 🐱")
             return
 
-        print(f"[CHAT] AI chat from {ctx.author} in #{getattr(ctx.channel, 'name', 'DM')}: '{question[:80]}'")
+        log.info("[CHAT] AI chat from %s in #%s: '%s'", ctx.author, getattr(ctx.channel, 'name', 'DM'), question[:80])
 
         # Parse attachments
         question_ref = [question]
@@ -102,13 +124,13 @@ def register_events(bot: commands.Bot) -> None:
 
         # Inline [context: ...] override
         inline_context = None
-        context_match = re.search(r'\[context:\s*(.+?)\]', question, re.IGNORECASE | re.DOTALL)
+        context_match = _CONTEXT_RE.search(question)
         if context_match:
             inline_context = context_match.group(1).strip()
-            question = re.sub(r'\[context:\s*.+?\]', '', question, flags=re.IGNORECASE | re.DOTALL).strip()
+            question = _CONTEXT_RE.sub('', question).strip()
 
         guild_id = ctx.guild.id if ctx.guild else ctx.author.id
-        server_context = custom_contexts.get(guild_id)
+        server_context = get_context(guild_id)
         combined_context = None
         if inline_context and server_context:
             combined_context = f"{server_context}\n\nInline context: {inline_context}"
@@ -135,11 +157,11 @@ def register_events(bot: commands.Bot) -> None:
             )
 
         await ctx.send(answer[:2000])
-        print(f"[CHAT] AI response sent to {ctx.author} ({len(answer)} chars)")
+        log.info("[CHAT] AI response sent to %s (%s chars)", ctx.author, len(answer))
+        if answer.startswith("❌"):
+            return  # failed reply — nothing worth remembering
 
         mem.add_exchange(question, answer)
-        save_conversations()
-        print(f"[CHAT] Exchange saved for {ctx.author} — launching vector memory extraction")
-        bot.loop.create_task(
-            extract_and_update_memories(user_id, username, question, answer, guild_id=guild_id)
-        )
+        mark_conversations_dirty(user_id)
+        log.info("[CHAT] Exchange recorded for %s — launching vector memory extraction", ctx.author)
+        schedule_extract(user_id, username, question, answer, guild_id=guild_id)
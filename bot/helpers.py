@@ -6,8 +6,14 @@ so command handlers stay concise.
 
 from __future__ import annotations
 
+import codecs
+import logging
+
+from services.http_session import get_session
 from services.pdf import extract_pdf_text
 
+log = logging.getLogger(__name__)
+
 # ── File extension sets ──────────────────────────────────
 
 IMAGE_EXTS = (".png", ".jpg", ".jpeg", ".gif", ".webp", ".bmp")
@@ -48,7 +54,7 @@ async def parse_attachments(
             att.content_type and att.content_type.startswith("image/")
         ):
             result.append({"type": "image", "url": att.url, "filename": att.filename})
-            print(f"[ATTACH] Image: {att.filename}")
+            log.info("[ATTACH] Image: %s", att.filename)
 
         # PDFs
         elif fname.endswith(".pdf") or (att.content_type and att.content_type == "application/pdf"):
@@ -57,14 +63,14 @@ async def parse_attachments(
                 pdf_text = extract_pdf_text(raw)
                 if pdf_text:
                     result.append({"type": "text", "filename": att.filename, "content": pdf_text})
-                    print(f"[ATTACH] PDF read: {att.filename} ({len(pdf_text)} chars)")
+                    log.info("[ATTACH] PDF read: %s (%s chars)", att.filename, len(pdf_text))
                 elif question_ref is not None:
                     question_ref[0] += f"\n[User attached a PDF: {att.filename} — scanned image, no extractable text]"
-                    print(f"[ATTACH] PDF has no extractable text: {att.filename}")
+                    log.info("[ATTACH] PDF has no extractable text: %s", att.filename)
             except Exception as e:
                 if question_ref is not None:
                     question_ref[0] += f"\n[User attached a PDF: {att.filename} — failed to read: {e}]"
-                print(f"[ATTACH] Failed to read PDF {att.filename}: {e}")
+                log.warning("[ATTACH] Failed to read PDF %s: %s", att.filename, e)
 
         # Text-based files
         elif any(fname.endswith(ext) for ext in TEXT_EXTS) or (
@@ -74,9 +80,9 @@ async def parse_attachments(
                 raw = await att.read()
                 text_content = raw.decode("utf-8", errors="replace")[:8000]
                 result.append({"type": "text", "filename": att.filename, "content": text_content})
-                print(f"[ATTACH] Text file read: {att.filename} ({len(text_content)} chars)")
+                log.info("[ATTACH] Text file read: %s (%s chars)", att.filename, len(text_content))
             except Exception as e:
-                print(f"[ATTACH] Failed to read {att.filename}: {e}")
+                log.warning("[ATTACH] Failed to read %s: %s", att.filename, e)
 
         # Unknown
         else:
@@ -85,20 +91,52 @@ async def parse_attachments(
                     f"\n[User attached a file: {att.filename} "
                     f"({att.content_type or 'unknown type'}) — cannot be read directly]"
                 )
-            print(f"[ATTACH] Unsupported attachment skipped: {att.filename} ({att.content_type})")
+            log.info("[ATTACH] Unsupported attachment skipped: %s (%s)", att.filename, att.content_type)
 
     return result
 
 
+async def read_attachment_text(att, max_bytes: int = 16384) -> str:
+    """Read the first *max_bytes* of an attachment and decode it as UTF-8.
+
+    Streams from the CDN and stops early, so a large upload is never held
+    in memory in full.  A multi-byte character cut off at the limit is
+    dropped; invalid UTF-8 raises ``UnicodeDecodeError``.
+    """
+    session = await get_session()
+    async with session.get(att.url) as resp:
+        resp.raise_for_status()
+        raw = b""
+        while len(raw) < max_bytes:
+            chunk = await resp.content.read(max_bytes - len(raw))
+            if not chunk:
+                break
+            raw += chunk
+    return codecs.getincrementaldecoder("utf-8")().decode(raw, final=False)
+
+
 # ── Response splitting ───────────────────────────────────
 
+def chunk_text(text: str, limit: int = 2000):
+    """Yield pieces of *text* no longer than *limit*, split on newlines.
+
+    Walks the string once with an index instead of re-slicing the
+    remainder after every chunk.
+    """
+    i, n = 0, len(text)
+    while n - i > limit:
+        split_at = text.rfind("\n", i, i + limit)
+        if split_at <= i:
+            split_at = i + limit
+        yield text[i:split_at]
+        i = split_at
+        while i < n and text[i].isspace():
+            i += 1
+    if i < n:
+        yield text[i:]
+
+
 async def send_long_response(ctx, text: str) -> None:
     """Send a potentially long response, splitting at Discord's 2 000-char limit."""
-    while len(text) > 2000:
-        split_at = text.rfind("\n", 0, 2000)
-        if split_at == -1:
-            split_at = 2000
-        await ctx.send(text[:split_at])
-        text = text[split_at:].lstrip()
-    if text:
-        await ctx.send(text)
+    for chunk in chunk_text(text):
+        await ctx.send(chunk)
@@ -21,10 +21,19 @@ OPENAI_API_KEY: str = os.getenv("OPENAI_API_KEY", "")
 MORNING_HOUR = 5 - 11 + 24
 AFTERNOON_HOUR = 12 - 11
 EVENING_HOUR = 20 - 11
+SCHEDULE_FETCH_TIMEOUT: float = float(os.getenv("SCHEDULE_FETCH_TIMEOUT", "10"))  # seconds per fetch
 
 # ── API endpoints ────────────────────────────────────────
 CAT_GIF_URL = "https://api.thecatapi.com/v1/images/search"
-CAT_FACT_URL = "https://catfact.ninja/fact"
+CAT_FACTS_URL = "https://catfact.ninja/facts"   # paginated, used for bulk prefetch
+
+# ── Cat API caching (seconds before a cached pool is refreshed) ──
+CAT_GIF_TTL: float = float(os.getenv("CAT_GIF_TTL", "60"))
+CAT_FACT_TTL: float = float(os.getenv("CAT_FACT_TTL", "300"))
+
+# ── Cat API fallbacks (used when an API is unreachable or too slow) ──
+FALLBACK_CAT_GIF = "https://media.giphy.com/media/JIX9t2j0ZTN9S/giphy.gif"
+FALLBACK_CAT_FACT = "Cats sleep for about 70% of their lives. 😴"
 
 # ── Embed colors ─────────────────────────────────────────
 MORNING_COLOR = 0xFFD700   # Gold
@@ -36,6 +45,9 @@ CHAT_MODEL: str = os.getenv("CHAT_MODEL", "gpt-4.1-mini")
 EXTRACTION_MODEL: str = os.getenv("EXTRACTION_MODEL", "gpt-4.1-nano")
 EMBEDDING_MODEL: str = os.getenv("EMBEDDING_MODEL", "text-embedding-3-small")
 EMBEDDING_DIMENSIONS: int = int(os.getenv("EMBEDDING_DIMENSIONS", "1536"))
+OPENAI_MAX_CONCURRENCY: int = int(os.getenv("OPENAI_MAX_CONCURRENCY", "8"))  # in-flight requests
+CHAT_MAX_COMPLETION_TOKENS: int = int(os.getenv("CHAT_MAX_COMPLETION_TOKENS", "600"))
+CHAT_HISTORY_CHARS: int = 400      # per history turn sent to the chat model
 
 # ── Vector Memory (ChromaDB) ────────────────────────────
 CHROMA_PERSIST_DIR: str = os.getenv(
@@ -46,10 +58,19 @@ CHROMA_COLLECTION_NAME: str = "user_memories"
 MEMORY_TOP_K: int = int(os.getenv("MEMORY_TOP_K", "5"))
 MAX_MEMORIES_PER_USER: int = int(os.getenv("MAX_MEMORIES_PER_USER", "150"))
 
+# ── Custom Context ──────────────────────────────────────
+MAX_CUSTOM_CONTEXTS: int = int(os.getenv("MAX_CUSTOM_CONTEXTS", "10000"))  # LRU cap (guilds)
+CONTEXTS_FILE: str = os.path.join(DATA_DIR, "contexts.msgpack")
+
 # ── Conversation History ────────────────────────────────
-CONVERSATIONS_FILE: str = os.path.join(DATA_DIR, "user_conversations.json")
+CONVERSATIONS_DB: str = os.path.join(DATA_DIR, "user_conversations.db")
+CONVERSATIONS_FILE: str = os.path.join(DATA_DIR, "user_conversations.json")  # legacy, migrated on load
 MAX_RECENT_MESSAGES: int = 10       # per-user rolling window (pairs)
 CONVERSATION_TTL_DAYS: int = 30     # auto-prune inactive users
 
 # ── Challenges ──────────────────────────────────────────
 CHALLENGE_REMINDER_HOURS: int = int(os.getenv("CHALLENGE_REMINDER_HOURS", "4"))
+
+# ── Logging ─────────────────────────────────────────────
+LOG_LEVEL: str = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FILE: str = os.getenv("LOG_FILE", os.path.join(DATA_DIR, "cat_supremacy.log"))
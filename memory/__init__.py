@@ -4,11 +4,13 @@ Public API re-exported for convenience::
 
     from memory import (
         # Conversation history
-        get_user_memory, load_all, save_all, prune_old_conversations,
+        get_user_memory, load_all, load_all_async, save_all, save_all_async,
+        mark_dirty, flush, flush_async,
+        prune_old_conversations,
         export_user_conversation, export_all_conversations,
         import_user_conversation, import_all_conversations,
         migrate_legacy_notes_to_vector_store,
-        extract_and_update_memories,
+        extract_and_update_memories, schedule_extract,
         # Vector store
         search_memories, store_memory, get_memory_count,
         get_all_memories, delete_user_memories,
@@ -22,7 +24,12 @@ Public API re-exported for convenience::
 from memory.conversation import (          # noqa: F401
     get_user_memory,
     load_all,
+    load_all_async,
     save_all,
+    save_all_async,
+    mark_dirty,
+    flush,
+    flush_async,
     prune_old_conversations,
     export_user_conversation,
     export_all_conversations,
@@ -30,6 +37,7 @@ from memory.conversation import (          # noqa: F401
     import_all_conversations,
     migrate_legacy_notes_to_vector_store,
     extract_and_update_memories,
+    schedule_extract,
 )
 
 # ── Vector store ─────────────────────────────────────────
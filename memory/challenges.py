@@ -12,6 +12,7 @@ from __future__ import annotations
 
 import datetime
 import json
+import logging
 import os
 import time
 from dataclasses import dataclass, field, asdict
@@ -19,6 +20,8 @@ from typing import Optional
 
 import config
 
+log = logging.getLogger(__name__)
+
 # ── Helpers ──────────────────────────────────────────────
 
 
@@ -161,7 +164,7 @@ def load_challenges() -> None:
     path = _path()
     os.makedirs(os.path.dirname(path), exist_ok=True)
     if not os.path.exists(path):
-        print("[CHALLENGE] No challenges file found — starting fresh")
+        log.info("[CHALLENGE] No challenges file found — starting fresh")
         return
     try:
         with open(path, "r", encoding="utf-8") as f:
@@ -174,9 +177,9 @@ def load_challenges() -> None:
                 "challenges": challenges,
             }
         total = sum(len(g["challenges"]) for g in _guilds.values())
-        print(f"[CHALLENGE] Loaded {total} challenges across {len(_guilds)} guilds")
+        log.info("[CHALLENGE] Loaded %s challenges across %s guilds", total, len(_guilds))
     except Exception as e:
-        print(f"[WARNING] Failed to load challenges: {e}")
+        log.warning("Failed to load challenges: %s", e)
 
 
 def save_challenges() -> None:
@@ -192,9 +195,9 @@ def save_challenges() -> None:
     try:
         with open(path, "w", encoding="utf-8") as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
-        print("[CHALLENGE] Challenges saved")
+        log.debug("[CHALLENGE] Challenges saved")
     except Exception as e:
-        print(f"[WARNING] Failed to save challenges: {e}")
+        log.warning("Failed to save challenges: %s", e)
 
 
 # ── Public API ───────────────────────────────────────────
@@ -226,7 +229,7 @@ def create_challenge(
     )
     gdata["challenges"].append(challenge)
     save_challenges()
-    print(f"[CHALLENGE] Created #{cid} '{title}' ({mode}) in guild {guild_id}")
+    log.info("[CHALLENGE] Created #%s '%s' (%s) in guild %s", cid, title, mode, guild_id)
     return challenge
 
 
@@ -269,7 +272,7 @@ def delete_challenge(guild_id: int, challenge_id: int) -> bool:
     gdata["challenges"] = [c for c in gdata["challenges"] if c.id != challenge_id]
     if len(gdata["challenges"]) < before:
         save_challenges()
-        print(f"[CHALLENGE] Deleted #{challenge_id} from guild {guild_id}")
+        log.info("[CHALLENGE] Deleted #%s from guild %s", challenge_id, guild_id)
         return True
     return False
 
@@ -288,7 +291,7 @@ def check_and_renew_expired() -> list[Challenge]:
                 renewed.append(c)
     if renewed:
         save_challenges()
-        print(f"[CHALLENGE] Renewed {len(renewed)} expired challenges")
+        log.info("[CHALLENGE] Renewed %s expired challenges", len(renewed))
     return renewed
 
 
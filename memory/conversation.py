@@ -1,4 +1,4 @@
-"""Rolling per-user conversation history with JSON persistence.
+"""Rolling per-user conversation history with SQLite persistence.
 
 Manages a short recent-messages window and delegates long-term memory
 storage to the vector store (via ``memory.evaluator``).
@@ -6,40 +6,78 @@ storage to the vector store (via ``memory.evaluator``).
 
 from __future__ import annotations
 
+import asyncio
 import json
+import logging
 import os
+import sqlite3
+import threading
 import time
-from dataclasses import dataclass, field, asdict
+from collections import deque
+from dataclasses import dataclass, field
 from typing import Optional
 
 import config
+from memory.evaluator import evaluate_and_store_memories
+from memory.vector_store import store_memory
+
+log = logging.getLogger(__name__)
+
+try:  # optional — several times faster than the stdlib for this store
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# ── JSON helpers (orjson if installed, stdlib otherwise) ──
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers
+# only need to catch the latter.
+
+def _dumps(obj, *, indent: bool = False) -> str:
+    """Encode *obj* as JSON text (compact unless *indent*)."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode()
+    if indent:
+        return json.dumps(obj, ensure_ascii=False, indent=2)
+    return json.dumps(obj, ensure_ascii=False, separators=(",", ":"))
+
+
+def _loads(raw: str | bytes):
+    """Decode JSON text or bytes."""
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
 
 
 # ── Data structures ──────────────────────────────────────
 
+def _recent_window(messages=()) -> deque[dict]:
+    """Return a deque holding at most MAX_RECENT_MESSAGES pairs."""
+    return deque(messages, maxlen=config.MAX_RECENT_MESSAGES * 2)
+
+
 @dataclass
 class UserConversation:
     """Per-user rolling conversation state."""
 
     user_id: int
     username: str = ""
-    recent_messages: list[dict] = field(default_factory=list)
+    # Bounded to the latest MAX_RECENT_MESSAGES pairs — old turns fall off
+    recent_messages: deque[dict] = field(default_factory=_recent_window)
     # Legacy field — kept for backward compat with old JSON files.
     long_term_notes: str = ""
     last_seen: float = 0.0
 
-    def trim_recent(self):
-        """Keep only the latest MAX_RECENT_MESSAGES pairs."""
-        max_entries = config.MAX_RECENT_MESSAGES * 2
-        if len(self.recent_messages) > max_entries:
-            self.recent_messages = self.recent_messages[-max_entries:]
+    def __post_init__(self):
+        # Loaders and importers pass plain lists
+        if not isinstance(self.recent_messages, deque):
+            self.recent_messages = _recent_window(self.recent_messages)
 
     def add_exchange(self, user_msg: str, assistant_msg: str):
-        """Append a user/assistant turn and trim."""
+        """Append a user/assistant turn (the window drops the oldest)."""
         self.recent_messages.append({"role": "user", "content": user_msg})
         self.recent_messages.append({"role": "assistant", "content": assistant_msg})
         self.last_seen = time.time()
-        self.trim_recent()
 
     def build_context_block(self) -> str:
         """Return a compact string for injection into the system prompt."""
@@ -54,61 +92,255 @@ class UserConversation:
 
 
 # ── In-memory store ──────────────────────────────────────
+# ``_store`` is the read cache; SQLite holds one row per user.
 _store: dict[int, UserConversation] = {}
+_dirty_users: set[int] = set()    # rows to upsert on the next save
+_deleted_users: set[int] = set()  # rows to delete on the next save
+
+# Changes within this window are coalesced into one write
+_SAVE_DELAY = 5.0
+_save_task: Optional[asyncio.Task] = None
 
 
 def get_user_memory(user_id: int, username: str = "") -> UserConversation:
     """Get or create a UserConversation for the given user."""
     if user_id not in _store:
         _store[user_id] = UserConversation(user_id=user_id, username=username)
-        print(f"[MEMORY] Created new conversation record for user {username} (ID: {user_id})")
+        log.debug(
+            "[MEMORY] Created new conversation record for user %s (ID: %s)",
+            username, user_id,
+        )
     mem = _store[user_id]
     if username:
         mem.username = username
     return mem
 
 
-# ── Persistence ──────────────────────────────────────────
+# ── Persistence (SQLite, one row per user) ───────────────
 
-def _conversations_path() -> str:
-    """Return the path to the conversations JSON file, creating the
-    parent directory if it doesn't exist."""
-    path = config.CONVERSATIONS_FILE
-    os.makedirs(os.path.dirname(path), exist_ok=True)
-    return path
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    user_id         INTEGER PRIMARY KEY,
+    username        TEXT NOT NULL DEFAULT '',
+    long_term_notes TEXT NOT NULL DEFAULT '',
+    last_seen       REAL NOT NULL DEFAULT 0,
+    recent_messages TEXT NOT NULL DEFAULT '[]'
+)
+"""
+
+_UPSERT = """
+INSERT INTO conversations (user_id, username, long_term_notes, last_seen, recent_messages)
+VALUES (?, ?, ?, ?, ?)
+ON CONFLICT(user_id) DO UPDATE SET
+    username = excluded.username,
+    long_term_notes = excluded.long_term_notes,
+    last_seen = excluded.last_seen,
+    recent_messages = excluded.recent_messages
+"""
+
+_db: Optional[sqlite3.Connection] = None
+_db_lock = threading.Lock()  # the connection is shared by worker threads
+
+
+def _connect() -> sqlite3.Connection:
+    """Return the shared connection, creating the database on first use."""
+    global _db
+    if _db is None:
+        path = config.CONVERSATIONS_DB
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        _db = sqlite3.connect(path, check_same_thread=False)
+        _db.execute("PRAGMA journal_mode=WAL")
+        _db.execute(_SCHEMA)
+        _db.commit()
+    return _db
+
+
+def _to_dict(mem: UserConversation) -> dict:
+    """Shallow dict of *mem* for JSON — unlike ``asdict`` it doesn't deep-copy
+    every message dict."""
+    return {
+        "user_id": mem.user_id,
+        "username": mem.username,
+        "recent_messages": list(mem.recent_messages),
+        "long_term_notes": mem.long_term_notes,
+        "last_seen": mem.last_seen,
+    }
+
+
+def _row(mem: UserConversation) -> tuple:
+    return (
+        mem.user_id,
+        mem.username,
+        mem.long_term_notes,
+        mem.last_seen,
+        _dumps(list(mem.recent_messages)),
+    )
+
+
+def _snapshot() -> tuple[list[tuple], list[tuple]]:
+    """Take the pending upserts and deletes, safe to write off the event loop."""
+    rows = [_row(_store[uid]) for uid in _dirty_users if uid in _store]
+    deletes = [(uid,) for uid in _deleted_users]
+    _dirty_users.clear()
+    _deleted_users.clear()
+    return rows, deletes
+
+
+def _write(rows: list[tuple], deletes: list[tuple]) -> bool:
+    """Apply a snapshot to the database in one transaction."""
+    try:
+        with _db_lock:
+            db = _connect()
+            with db:
+                if deletes:
+                    db.executemany("DELETE FROM conversations WHERE user_id = ?", deletes)
+                if rows:
+                    db.executemany(_UPSERT, rows)
+        log.debug("[MEMORY] Conversations saved (%s updated, %s removed)", len(rows), len(deletes))
+        return True
+    except sqlite3.Error as e:
+        log.warning("Failed to save conversations: %s", e)
+        return False
+
+
+def _requeue(rows: list[tuple], deletes: list[tuple]) -> None:
+    """Put a failed snapshot back so the next save retries it."""
+    _dirty_users.update(row[0] for row in rows)
+    _deleted_users.update(uid for (uid,) in deletes)
 
 
 def save_all():
-    """Persist the entire store to disk."""
-    print(f"[MEMORY] Saving conversations for {len(_store)} users to disk...")
-    data = {}
-    for uid, mem in _store.items():
-        data[str(uid)] = asdict(mem)
+    """Persist every user to disk (blocking — shutdown hooks only)."""
+    log.info("[MEMORY] Saving conversations for %s users to disk...", len(_store))
+    _dirty_users.update(_store)
+    rows, deletes = _snapshot()
+    if not _write(rows, deletes):
+        _requeue(rows, deletes)
+
+
+async def save_all_async():
+    """Persist every user, writing in a worker thread."""
+    _dirty_users.update(_store)
+    await flush_async()
+
+
+def mark_dirty(user_id: Optional[int] = None):
+    """Flag a user (or, with no argument, everyone) as changed.
+
+    Schedules a debounced save ``_SAVE_DELAY`` seconds later, so a burst
+    of changes costs a single transaction touching only those rows.
+    """
+    if user_id is None:
+        _dirty_users.update(_store)
+    else:
+        _dirty_users.add(user_id)
+    _schedule_save()
+
+
+def _has_pending() -> bool:
+    return bool(_dirty_users or _deleted_users)
+
+
+def _schedule_save(delay: float = _SAVE_DELAY) -> None:
+    """Start the delayed-save task unless one is already pending."""
+    global _save_task
+    if _save_task is not None:
+        return
     try:
-        with open(_conversations_path(), "w", encoding="utf-8") as f:
-            json.dump(data, f, ensure_ascii=False, indent=2)
-        print("[MEMORY] Conversations saved successfully")
-    except Exception as e:
-        print(f"[WARNING] Failed to save conversations: {e}")
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # no loop (e.g. during shutdown) — ``flush()`` picks it up
+    _save_task = loop.create_task(_delayed_save(delay))
 
 
-def load_all():
-    """Load conversations from disk (call once at startup)."""
-    print("[MEMORY] Loading conversations from disk...")
-    global _store
-    path = _conversations_path()
-    if not os.path.exists(path):
-        # Check legacy location
-        legacy_path = os.path.join(config.PROJECT_ROOT, "user_memories.json")
-        if os.path.exists(legacy_path):
-            print(f"[MEMORY] Found legacy file at {legacy_path} — migrating to {path}")
-            path = legacy_path
-        else:
-            return
+async def _delayed_save(delay: float) -> None:
+    global _save_task
+    try:
+        await asyncio.sleep(delay)
+        await flush_async()
+    finally:
+        _save_task = None
+        if _has_pending():  # changed again while writing
+            _schedule_save(delay)
+
+
+def flush() -> bool:
+    """Persist pending changes now (blocking).
+
+    Cancels any pending delayed save.  Returns ``True`` if a write happened.
+    """
+    if _save_task is not None:
+        _save_task.cancel()
+    if not _has_pending():
+        return False
+    rows, deletes = _snapshot()
+    if not _write(rows, deletes):
+        _requeue(rows, deletes)
+    return True
+
+
+async def flush_async() -> bool:
+    """Like ``flush()``, but the database write runs in a worker thread.
+
+    The snapshot is taken on the event loop so the store isn't mutated
+    mid-serialisation.
+    """
+    if not _has_pending():
+        return False
+    rows, deletes = _snapshot()
+    if not await asyncio.to_thread(_write, rows, deletes):
+        _requeue(rows, deletes)
+    return True
+
+
+def _read_legacy_json() -> Optional[dict]:
+    """Read a pre-SQLite conversations JSON file, if one exists."""
+    for path in (
+        config.CONVERSATIONS_FILE,
+        os.path.join(config.PROJECT_ROOT, "user_memories.json"),
+    ):
+        if os.path.exists(path):
+            log.info(
+                "[MEMORY] Found legacy file at %s — migrating to %s",
+                path, config.CONVERSATIONS_DB,
+            )
+            try:
+                with open(path, "rb") as f:
+                    return _loads(f.read())
+            except Exception as e:
+                log.warning("Failed to read legacy conversations: %s", e)
+                return None
+    return None
+
+
+def _read() -> tuple[list[tuple], Optional[dict]]:
+    """Return all rows, or the legacy JSON blob if the table is empty."""
     try:
-        with open(path, "r", encoding="utf-8") as f:
-            data = json.load(f)
-        for uid_str, blob in data.items():
+        with _db_lock:
+            rows = _connect().execute(
+                "SELECT user_id, username, long_term_notes, last_seen, recent_messages "
+                "FROM conversations"
+            ).fetchall()
+    except sqlite3.Error as e:
+        log.warning("Failed to load conversations: %s", e)
+        return [], None
+    if rows:
+        return rows, None
+    return [], _read_legacy_json()
+
+
+def _populate(rows: list[tuple], legacy: Optional[dict]) -> None:
+    """Fill the store from database rows (or a legacy JSON blob)."""
+    try:
+        for uid, username, notes, last_seen, recent in rows:
+            _store[uid] = UserConversation(
+                user_id=uid,
+                username=username,
+                recent_messages=_loads(recent),
+                long_term_notes=notes,
+                last_seen=last_seen,
+            )
+        for uid_str, blob in (legacy or {}).items():
             uid = int(uid_str)
             _store[uid] = UserConversation(
                 user_id=uid,
@@ -117,24 +349,44 @@ def load_all():
                 long_term_notes=blob.get("long_term_notes", ""),
                 last_seen=blob.get("last_seen", 0.0),
             )
-        print(f"[INFO] Loaded conversations for {len(_store)} users.")
+        log.info("Loaded conversations for %s users.", len(_store))
     except Exception as e:
-        print(f"[WARNING] Failed to load conversations: {e}")
+        log.warning("Failed to load conversations: %s", e)
+    if legacy:
+        mark_dirty()  # copy the migrated users into SQLite
+
+
+def load_all():
+    """Load conversations from disk (blocking)."""
+    log.info("[MEMORY] Loading conversations from disk...")
+    _populate(*_read())
+
+
+async def load_all_async():
+    """Load conversations from disk, querying in a worker thread.
+
+    Call once at startup.
+    """
+    log.info("[MEMORY] Loading conversations from disk...")
+    rows, legacy = await asyncio.to_thread(_read)
+    _populate(rows, legacy)
 
 
 def prune_old_conversations():
     """Remove users who haven't interacted in CONVERSATION_TTL_DAYS days."""
     ttl_days = config.CONVERSATION_TTL_DAYS
-    print(f"[MEMORY] Pruning conversations older than {ttl_days} days...")
+    log.info("[MEMORY] Pruning conversations older than %s days...", ttl_days)
     cutoff = time.time() - (ttl_days * 86400)
     to_remove = [uid for uid, mem in _store.items() if mem.last_seen < cutoff and mem.last_seen > 0]
     for uid in to_remove:
         del _store[uid]
+        _dirty_users.discard(uid)
+        _deleted_users.add(uid)
     if to_remove:
-        print(f"[MEMORY] Pruned conversations for {len(to_remove)} inactive users.")
-        save_all()
+        log.info("[MEMORY] Pruned conversations for %s inactive users.", len(to_remove))
+        _schedule_save()
     else:
-        print("[MEMORY] No old conversations to prune")
+        log.info("[MEMORY] No old conversations to prune")
 
 
 # ── Export / Import ──────────────────────────────────────
@@ -144,19 +396,19 @@ def export_user_conversation(user_id: int) -> Optional[str]:
     mem = _store.get(user_id)
     if mem is None:
         return None
-    return json.dumps(asdict(mem), ensure_ascii=False, indent=2)
+    return _dumps(_to_dict(mem), indent=True)
 
 
 def export_all_conversations() -> str:
     """Export the entire conversation store as a JSON string."""
-    data = {str(uid): asdict(mem) for uid, mem in _store.items()}
-    return json.dumps(data, ensure_ascii=False, indent=2)
+    data = {str(uid): _to_dict(mem) for uid, mem in _store.items()}
+    return _dumps(data, indent=True)
 
 
 def import_user_conversation(user_id: int, raw_json: str) -> str:
     """Import a single user's conversation from a JSON string."""
     try:
-        blob = json.loads(raw_json)
+        blob = _loads(raw_json)
     except json.JSONDecodeError as e:
         return f"Invalid JSON: {e}"
 
@@ -168,8 +420,8 @@ def import_user_conversation(user_id: int, raw_json: str) -> str:
             long_term_notes=blob.get("long_term_notes", ""),
             last_seen=blob.get("last_seen", time.time()),
         )
-        save_all()
-        print(f"[MEMORY] Imported single-user conversation for user {user_id}")
+        mark_dirty(user_id)
+        log.info("[MEMORY] Imported single-user conversation for user %s", user_id)
         return "ok"
     else:
         return "Unrecognized format — expected a single-user conversation JSON."
@@ -178,7 +430,7 @@ def import_user_conversation(user_id: int, raw_json: str) -> str:
 def import_all_conversations(raw_json: str) -> tuple[int, str]:
     """Import a full conversation store from a JSON string."""
     try:
-        data = json.loads(raw_json)
+        data = _loads(raw_json)
     except json.JSONDecodeError as e:
         return 0, f"Invalid JSON: {e}"
 
@@ -200,8 +452,8 @@ def import_all_conversations(raw_json: str) -> tuple[int, str]:
         )
         count += 1
 
-    save_all()
-    print(f"[MEMORY] Imported conversations for {count} users from uploaded file")
+    mark_dirty()
+    log.info("[MEMORY] Imported conversations for %s users from uploaded file", count)
     return count, ""
 
 
@@ -216,17 +468,41 @@ async def extract_and_update_memories(
     guild_id: int | None = None,
 ) -> None:
     """Evaluate an exchange and store any valuable memories in the vector DB."""
-    from memory.evaluator import evaluate_and_store_memories
-
     try:
         count = await evaluate_and_store_memories(
             user_id, username, user_message, assistant_response,
             guild_id=guild_id,
         )
         if count:
-            print(f"[MEMORY] {count} new vector memories extracted for {username}")
+            log.debug("[MEMORY] %s new vector memories extracted for %s", count, username)
     except Exception as e:
-        print(f"[WARNING] Vector memory extraction failed for {username}: {e}")
+        log.warning("Vector memory extraction failed for %s: %s", username, e)
+
+
+# Strong refs to fire-and-forget extraction tasks (the loop only keeps weak ones)
+_background_tasks: set[asyncio.Task] = set()
+
+
+def schedule_extract(
+    user_id: int,
+    username: str,
+    user_message: str,
+    assistant_response: str,
+    guild_id: int | None = None,
+) -> asyncio.Task:
+    """Run ``extract_and_update_memories`` in the background.
+
+    Extraction never affects the reply already sent, so callers don't
+    wait on its OpenAI round trip.
+    """
+    task = asyncio.get_running_loop().create_task(
+        extract_and_update_memories(
+            user_id, username, user_message, assistant_response, guild_id=guild_id,
+        )
+    )
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+    return task
 
 
 async def migrate_legacy_notes_to_vector_store() -> int:
@@ -235,8 +511,6 @@ async def migrate_legacy_notes_to_vector_store() -> int:
     Call once at startup after ``load_all()``.
     Returns the total number of memories migrated.
     """
-    from memory.vector_store import store_memory
-
     total = 0
     migrated_users: list[int] = []
 
@@ -254,14 +528,17 @@ async def migrate_legacy_notes_to_vector_store() -> int:
                 if ok:
                     total += 1
             except Exception as e:
-                print(f"[MEMORY] Failed to migrate note for user {uid}: {e}")
+                log.warning("[MEMORY] Failed to migrate note for user %s: %s", uid, e)
 
         migrated_users.append(uid)
 
     for uid in migrated_users:
         _store[uid].long_term_notes = ""
+        mark_dirty(uid)
     if migrated_users:
-        save_all()
-        print(f"[MEMORY] Migrated {total} legacy notes from {len(migrated_users)} users to vector store")
+        log.info(
+            "[MEMORY] Migrated %s legacy notes from %s users to vector store",
+            total, len(migrated_users),
+        )
 
     return total
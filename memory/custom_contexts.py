@@ -0,0 +1,144 @@
+"""Per-server custom context set via ``@cat context``.
+
+Held in a bounded LRU map so a long-running bot in many guilds can't
+grow without limit; the least recently used entry is evicted once
+``config.MAX_CUSTOM_CONTEXTS`` is exceeded.
+
+Persisted to ``config.CONTEXTS_FILE`` as msgpack.  Changes schedule a
+debounced save; ``flush()`` writes immediately (on shutdown).  Writes are
+atomic.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from collections import OrderedDict
+from typing import Optional
+
+import msgpack
+
+import config
+
+log = logging.getLogger(__name__)
+
+# ── In-memory LRU store ──────────────────────────────────
+_contexts: OrderedDict[int, str] = OrderedDict()
+_dirty: bool = False  # unsaved changes pending (see flush)
+
+# Changes within this window are coalesced into one write
+_SAVE_DELAY = 5.0
+_save_task: Optional[asyncio.Task] = None
+
+
+def get_context(guild_id: int) -> Optional[str]:
+    """Return the custom context for a guild (or DM user), if any."""
+    text = _contexts.get(guild_id)
+    if text is not None:
+        _contexts.move_to_end(guild_id)
+    return text
+
+
+def set_context(guild_id: int, text: str) -> None:
+    """Set the custom context for a guild, evicting the oldest if full."""
+    _contexts[guild_id] = text
+    _contexts.move_to_end(guild_id)
+    while len(_contexts) > config.MAX_CUSTOM_CONTEXTS:
+        evicted, _ = _contexts.popitem(last=False)
+        log.info("[CONTEXT] Evicted least-recently-used context for guild %s", evicted)
+    _mark_dirty()
+
+
+def clear_context(guild_id: int) -> None:
+    """Remove the custom context for a guild."""
+    if _contexts.pop(guild_id, None) is not None:
+        _mark_dirty()
+
+
+# ── Persistence ──────────────────────────────────────────
+
+def _mark_dirty() -> None:
+    """Flag the store as changed and start the delayed save if idle."""
+    global _dirty, _save_task
+    _dirty = True
+    if _save_task is not None:
+        return
+    try:
+        loop = asyncio.get_running_loop()
+    except RuntimeError:
+        return  # no loop — ``flush()`` picks it up
+    _save_task = loop.create_task(_delayed_save())
+
+
+async def _delayed_save() -> None:
+    global _save_task
+    try:
+        await asyncio.sleep(_SAVE_DELAY)
+        await flush_async()
+    finally:
+        _save_task = None
+        if _dirty:  # changed again while writing, or the write failed
+            _mark_dirty()
+
+
+def _write(packed: bytes) -> bool:
+    """Atomically replace the contexts file with *packed*; ``True`` on success."""
+    path = config.CONTEXTS_FILE
+    tmp = path + ".tmp"
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp, "wb") as f:
+            f.write(packed)
+        os.replace(tmp, path)
+        log.debug("[CONTEXT] Saved %s custom context(s)", len(_contexts))
+        return True
+    except OSError as e:
+        log.warning("Failed to save custom contexts: %s", e)
+        return False
+
+
+def load_contexts() -> None:
+    """Load custom contexts from disk (call once at startup)."""
+    path = config.CONTEXTS_FILE
+    if not os.path.exists(path):
+        return
+    try:
+        with open(path, "rb") as f:
+            data = msgpack.unpackb(f.read(), strict_map_key=False)
+    except (OSError, ValueError, msgpack.UnpackException) as e:
+        log.warning("Failed to load custom contexts: %s", e)
+        return
+    # Stored oldest-first, so LRU order survives the restart
+    _contexts.clear()
+    _contexts.update(data)
+    while len(_contexts) > config.MAX_CUSTOM_CONTEXTS:
+        _contexts.popitem(last=False)
+    log.info("[CONTEXT] Loaded %s custom context(s)", len(_contexts))
+
+
+def flush() -> bool:
+    """Persist the contexts now if anything changed; ``True`` if a write succeeded."""
+    global _dirty
+    if _save_task is not None:
+        _save_task.cancel()
+    if not _dirty:
+        return False
+    _dirty = False
+    if not _write(msgpack.packb(dict(_contexts))):
+        _dirty = True  # keep the changes for the next flush
+        return False
+    return True
+
+
+async def flush_async() -> bool:
+    """Like ``flush()``, but the file write runs in a worker thread."""
+    global _dirty
+    if not _dirty:
+        return False
+    _dirty = False
+    packed = msgpack.packb(dict(_contexts))  # pack on the loop — store may change
+    if not await asyncio.to_thread(_write, packed):
+        _dirty = True  # retried by the next delayed save
+        return False
+    return True
@@ -7,9 +7,15 @@ a lightweight model to decide if any long-term memories should be stored.
 from __future__ import annotations
 
 import json
+import logging
+from collections import OrderedDict
 
 import config
+from memory.guild_settings import get as gs_get
 from memory.vector_store import search_memories, store_memory
+from services.openai_client import get_openai_client, openai_limit
+
+log = logging.getLogger(__name__)
 
 # ── Extraction prompt ────────────────────────────────────
 
@@ -49,6 +55,37 @@ Rules:
   - Use third-person ("User …")
 """
 
+# ── Local pre-filter ─────────────────────────────────────
+# Messages this short or this generic never carry a lasting fact, so
+# they skip the search + extraction round trips entirely.
+_MIN_MESSAGE_LEN = 20
+SMALL_TALK: frozenset[str] = frozenset({
+    "hi", "hello", "hey", "yo", "sup", "lol", "lmao", "ok", "okay", "k",
+    "thanks", "thank you", "thx", "ty", "nice", "cool", "good morning",
+    "good night", "gn", "gm", "bye", "meow", "mrrp", "purr", "yes", "no",
+})
+
+# Hash of the last message evaluated per user — repeats are skipped.
+# LRU-bounded so users who have gone quiet fall out of the map.
+_MAX_TRACKED_USERS = 1024
+_last_evaluated: OrderedDict[int, int] = OrderedDict()
+
+
+def _worth_evaluating(user_id: int, user_message: str) -> bool:
+    """Cheap check for whether an exchange could hold a new memory."""
+    text = user_message.strip()
+    if len(text) < _MIN_MESSAGE_LEN or text.lower().rstrip("!.?~ ") in SMALL_TALK:
+        return False
+    return _last_evaluated.get(user_id) != hash(text)
+
+
+def _mark_evaluated(user_id: int, user_message: str) -> None:
+    """Remember *user_message* as evaluated (call once extraction succeeded)."""
+    _last_evaluated[user_id] = hash(user_message.strip())
+    _last_evaluated.move_to_end(user_id)
+    while len(_last_evaluated) > _MAX_TRACKED_USERS:
+        _last_evaluated.popitem(last=False)
+
 
 async def evaluate_and_store_memories(
     user_id: int,
@@ -62,12 +99,16 @@ async def evaluate_and_store_memories(
     Returns the number of new memories stored (0 if nothing noteworthy).
     """
     if not config.OPENAI_API_KEY:
-        print("[VECMEM] Memory evaluation skipped — no OpenAI API key")
+        log.debug("[VECMEM] Memory evaluation skipped — no OpenAI API key")
+        return 0
+    if not _worth_evaluating(user_id, user_message):
+        log.debug(
+            "[VECMEM] Memory evaluation skipped for %s — trivial or repeated message",
+            username,
+        )
         return 0
 
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+    client = get_openai_client()
 
     # Fetch existing memories to prevent duplicates
     existing = await search_memories(user_id, user_message, top_k=10)
@@ -82,28 +123,30 @@ async def evaluate_and_store_memories(
 
     try:
         if guild_id:
-            from memory.guild_settings import get as gs_get
             extraction_model = gs_get(guild_id, "extraction_model")
         else:
             extraction_model = config.EXTRACTION_MODEL
-        resp = await client.chat.completions.create(
-            model=extraction_model,
-            messages=[
-                {"role": "system", "content": "You extract user memories. Respond only with JSON or NONE."},
-                {"role": "user", "content": prompt},
-            ],
-            max_completion_tokens=300,
-            temperature=0.3,
-        )
+        async with openai_limit:
+            resp = await client.chat.completions.create(
+                model=extraction_model,
+                messages=[
+                    {"role": "system", "content": "You extract user memories. Respond only with JSON or NONE."},
+                    {"role": "user", "content": prompt},
+                ],
+                max_completion_tokens=300,
+                temperature=0.3,
+            )
+        # Only a completed evaluation counts — a failed call is retried next time
+        _mark_evaluated(user_id, user_message)
         usage = resp.usage
-        print(
-            f"[VECMEM] Evaluation API call for {username} | "
-            f"tokens: prompt={usage.prompt_tokens}, completion={usage.completion_tokens}, total={usage.total_tokens}"
+        log.debug(
+            "[VECMEM] Evaluation API call for %s | tokens: prompt=%s, completion=%s, total=%s",
+            username, usage.prompt_tokens, usage.completion_tokens, usage.total_tokens,
         )
         raw = resp.choices[0].message.content.strip()
 
         if not raw or raw.upper() == "NONE":
-            print(f"[VECMEM] No new memories to store for {username}")
+            log.debug("[VECMEM] No new memories to store for %s", username)
             return 0
 
         # Parse the JSON response
@@ -114,7 +157,7 @@ async def evaluate_and_store_memories(
                     raw = raw[4:].strip()
             new_memories = json.loads(raw)
         except json.JSONDecodeError:
-            print(f"[VECMEM] Could not parse extraction response: {raw[:100]}")
+            log.warning("[VECMEM] Could not parse extraction response: %s", raw[:100])
             return 0
 
         if not isinstance(new_memories, list):
@@ -130,9 +173,9 @@ async def evaluate_and_store_memories(
                     stored += 1
 
         if stored:
-            print(f"[VECMEM] Stored {stored} new memories for {username}")
+            log.debug("[VECMEM] Stored %s new memories for %s", stored, username)
         return stored
 
     except Exception as e:
-        print(f"[VECMEM] Memory evaluation failed for {username}: {e}")
+        log.warning("[VECMEM] Memory evaluation failed for %s: %s", username, e)
         return 0
@@ -8,12 +8,15 @@ take effect immediately without a bot restart.
 from __future__ import annotations
 
 import json
+import logging
 import os
 from dataclasses import dataclass, field, asdict
 from typing import Any
 
 import config
 
+log = logging.getLogger(__name__)
+
 # ── File path ────────────────────────────────────────────
 _SETTINGS_FILE = os.path.join(config.DATA_DIR, "guild_settings.json")
 
@@ -72,9 +75,9 @@ def load_all_settings() -> dict[str, dict[str, Any]]:
         try:
             with open(_SETTINGS_FILE, "r", encoding="utf-8") as f:
                 _cache = json.load(f)
-            print(f"[SETTINGS] Loaded settings for {len(_cache)} guild(s)")
+            log.info("[SETTINGS] Loaded settings for %s guild(s)", len(_cache))
         except Exception as e:
-            print(f"[ERROR] Failed to load guild settings: {e}")
+            log.error("Failed to load guild settings: %s", e)
             _cache = {}
     else:
         _cache = {}
@@ -88,7 +91,7 @@ def save_all_settings() -> None:
         with open(_SETTINGS_FILE, "w", encoding="utf-8") as f:
             json.dump(_cache, f, indent=2)
     except Exception as e:
-        print(f"[ERROR] Failed to save guild settings: {e}")
+        log.error("Failed to save guild settings: %s", e)
 
 
 def _guild_key(guild_id: int) -> str:
@@ -124,7 +127,7 @@ def set(guild_id: int, key: str, value: Any) -> None:
         _cache[gk] = {}
     _cache[gk][key] = value
     save_all_settings()
-    print(f"[SETTINGS] {key} = {value!r} for guild {guild_id}")
+    log.info("[SETTINGS] %s = %r for guild %s", key, value, guild_id)
 
 
 def reset(guild_id: int, key: str) -> Any:
@@ -27,26 +27,29 @@ def format_memories_block(memories: list[Memory]) -> str:
     return "\n".join(lines)
 
 
+# ── Fixed prompt fragments ───────────────────────────────
+_MEMORY_PREAMBLE = (
+    "\n\nYou have long-term memories about this user from past "
+    "conversations. Use them naturally — reference what you know when "
+    "relevant, but don't list them all at once. Act as if you genuinely "
+    "remember these things.\n\n"
+)
+_CUSTOM_CONTEXT_HEADER = "\n\nAdditional context provided by the user:\n"
+
+
 def build_system_prompt(
     base_prompt: str,
     memory_context: str = "",
     custom_context: str | None = None,
 ) -> str:
     """Assemble the full system prompt with optional memory and custom context."""
-    parts = [base_prompt]
-
+    if memory_context and custom_context:
+        return f"{base_prompt}{_MEMORY_PREAMBLE}{memory_context}{_CUSTOM_CONTEXT_HEADER}{custom_context}"
     if memory_context:
-        parts.append(
-            "\n\nYou have long-term memories about this user from past "
-            "conversations. Use them naturally — reference what you know when "
-            "relevant, but don't list them all at once. Act as if you genuinely "
-            "remember these things.\n\n" + memory_context
-        )
-
+        return f"{base_prompt}{_MEMORY_PREAMBLE}{memory_context}"
     if custom_context:
-        parts.append(f"\n\nAdditional context provided by the user:\n{custom_context}")
-
-    return "".join(parts)
+        return f"{base_prompt}{_CUSTOM_CONTEXT_HEADER}{custom_context}"
+    return base_prompt  # common case — no copy at all
 
 
 def build_messages(
@@ -61,11 +64,6 @@ def build_messages(
     Returns a ready-to-send messages list for
     ``client.chat.completions.create()``.
     """
-    messages = [{"role": "system", "content": system_prompt}]
-
-    if recent_messages:
-        messages.extend(recent_messages)
-
     if attachments:
         user_content: list[dict] = []
         text_parts = [user_message] if user_message else []
@@ -80,8 +78,13 @@ def build_messages(
                     "type": "image_url",
                     "image_url": {"url": att["url"], "detail": image_detail},
                 })
-        messages.append({"role": "user", "content": user_content})
+        user_turn = {"role": "user", "content": user_content}
     else:
-        messages.append({"role": "user", "content": user_message})
-
-    return messages
+        user_turn = {"role": "user", "content": user_message}
+
+    # One list literal — sized once, no append/extend growth
+    return [
+        {"role": "system", "content": system_prompt},
+        *(recent_messages or ()),
+        user_turn,
+    ]
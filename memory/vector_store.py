@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import json
+import logging
 import time
 import uuid
 from typing import Optional
@@ -18,6 +19,8 @@ import config
 from memory.models import Memory
 from services.embedding import generate_embedding
 
+log = logging.getLogger(__name__)
+
 
 # ── ChromaDB client (initialised lazily) ─────────────────
 
@@ -31,14 +34,17 @@ def _get_collection() -> chromadb.Collection:
     if _collection is not None:
         return _collection
 
-    print(f"[VECMEM] Initializing ChromaDB at {config.CHROMA_PERSIST_DIR}")
+    log.info("[VECMEM] Initializing ChromaDB at %s", config.CHROMA_PERSIST_DIR)
     _client = chromadb.PersistentClient(path=config.CHROMA_PERSIST_DIR)
     _collection = _client.get_or_create_collection(
         name=config.CHROMA_COLLECTION_NAME,
         metadata={"hnsw:space": "cosine"},
     )
     count = _collection.count()
-    print(f"[VECMEM] Collection '{config.CHROMA_COLLECTION_NAME}' ready — {count} memories total")
+    log.info(
+        "[VECMEM] Collection '%s' ready — %s memories total",
+        config.CHROMA_COLLECTION_NAME, count,
+    )
     return _collection
 
 
@@ -57,7 +63,7 @@ async def store_memory(
     if embedding is None:
         embedding = await generate_embedding(memory_text)
     if embedding is None:
-        print("[VECMEM] Skipping store — embedding generation failed")
+        log.warning("[VECMEM] Skipping store — embedding generation failed")
         return False
 
     memory_id = str(uuid.uuid4())
@@ -79,14 +85,14 @@ async def store_memory(
             documents=[memory_text],
             metadatas=[metadata],
         )
-        print(
-            f"[VECMEM] Stored memory {memory_id[:8]}… for user {user_id_str} | "
-            f"category={category} | text='{memory_text[:60]}'"
+        log.debug(
+            "[VECMEM] Stored memory %s… for user %s | category=%s | text='%s'",
+            memory_id[:8], user_id_str, category, memory_text[:60],
         )
         asyncio.get_event_loop().create_task(_auto_prune(user_id))
         return True
     except Exception as e:
-        print(f"[VECMEM] Failed to store memory: {e}")
+        log.warning("[VECMEM] Failed to store memory: %s", e)
         return False
 
 
@@ -101,7 +107,7 @@ async def search_memories(
 
     query_embedding = await generate_embedding(query_text)
     if query_embedding is None:
-        print("[VECMEM] Search skipped — could not embed query")
+        log.debug("[VECMEM] Search skipped — could not embed query")
         return []
 
     user_id_str = str(user_id)
@@ -127,13 +133,13 @@ async def search_memories(
                     category=results["metadatas"][0][i].get("category", "general"),
                     distance=results["distances"][0][i] if results["distances"] else 0.0,
                 ))
-        print(
-            f"[VECMEM] Search for user {user_id_str} returned {len(memories)} memories "
-            f"(query='{query_text[:50]}')"
+        log.debug(
+            "[VECMEM] Search for user %s returned %s memories (query='%s')",
+            user_id_str, len(memories), query_text[:50],
         )
         return memories
     except Exception as e:
-        print(f"[VECMEM] Search failed: {e}")
+        log.warning("[VECMEM] Search failed: %s", e)
         return []
 
 
@@ -149,7 +155,7 @@ async def get_memory_count(user_id: int) -> int:
         )
         return len(result["ids"]) if result and result["ids"] else 0
     except Exception as e:
-        print(f"[VECMEM] Failed to count memories for user {user_id_str}: {e}")
+        log.warning("[VECMEM] Failed to count memories for user %s: %s", user_id_str, e)
         return 0
 
 
@@ -176,7 +182,7 @@ async def get_all_memories(user_id: int) -> list[Memory]:
         memories.sort(key=lambda m: m.timestamp, reverse=True)
         return memories
     except Exception as e:
-        print(f"[VECMEM] Failed to retrieve all memories for user {user_id_str}: {e}")
+        log.warning("[VECMEM] Failed to retrieve all memories for user %s: %s", user_id_str, e)
         return []
 
 
@@ -193,10 +199,10 @@ async def delete_user_memories(user_id: int) -> int:
         ids = result["ids"] if result and result["ids"] else []
         if ids:
             await asyncio.to_thread(collection.delete, ids=ids)
-        print(f"[VECMEM] Deleted {len(ids)} memories for user {user_id_str}")
+        log.info("[VECMEM] Deleted %s memories for user %s", len(ids), user_id_str)
         return len(ids)
     except Exception as e:
-        print(f"[VECMEM] Failed to delete memories for user {user_id_str}: {e}")
+        log.warning("[VECMEM] Failed to delete memories for user %s: %s", user_id_str, e)
         return 0
 
 
@@ -230,13 +236,13 @@ async def prune_memories(
         excess = len(ids) - max_count
         to_delete = [pair[0] for pair in id_ts_pairs[:excess]]
         await asyncio.to_thread(collection.delete, ids=to_delete)
-        print(
-            f"[VECMEM] Pruned {excess} oldest memories for user {user_id_str} "
-            f"(was {len(ids)}, now {max_count})"
+        log.info(
+            "[VECMEM] Pruned %s oldest memories for user %s (was %s, now %s)",
+            excess, user_id_str, len(ids), max_count,
         )
         return excess
     except Exception as e:
-        print(f"[VECMEM] Prune failed for user {user_id_str}: {e}")
+        log.warning("[VECMEM] Prune failed for user %s: %s", user_id_str, e)
         return 0
 
 
@@ -245,7 +251,7 @@ async def _auto_prune(user_id: int) -> None:
     try:
         await prune_memories(user_id)
     except Exception as e:
-        print(f"[VECMEM] Auto-prune error: {e}")
+        log.warning("[VECMEM] Auto-prune error: %s", e)
 
 
 # ── Export / Import helpers ──────────────────────────────
@@ -290,5 +296,5 @@ async def import_user_memories_json(user_id: int, raw_json: str) -> tuple[int, s
             if ok:
                 imported += 1
 
-    print(f"[VECMEM] Imported {imported} memories for user {user_id}")
+    log.info("[VECMEM] Imported %s memories for user %s", imported, user_id)
     return imported, ""
@@ -1,13 +1,48 @@
 """
 Cat Supremacy — Discord bot entry point.
 
-Validates configuration and launches the bot.
+Validates configuration, sets up logging and launches the bot.
 See ARCHITECTURE.md for the full project structure.
 """
 
+import logging
+import logging.handlers
+import os
+import queue
+
 import config
 from bot import bot
 
+_LOG_FORMAT = "%(asctime)s %(levelname)-7s %(name)s: %(message)s"
+
+
+def _setup_logging() -> logging.handlers.QueueListener:
+    """Route all log records through a queue drained by a background thread.
+
+    The event loop only enqueues records; the stream and file writes happen
+    on the listener thread so a slow terminal or disk never blocks Discord.
+    """
+    formatter = logging.Formatter(_LOG_FORMAT)
+
+    os.makedirs(os.path.dirname(config.LOG_FILE) or ".", exist_ok=True)
+    file_handler = logging.handlers.RotatingFileHandler(
+        config.LOG_FILE, maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8",
+    )
+    stream_handler = logging.StreamHandler()
+    for handler in (file_handler, stream_handler):
+        handler.setFormatter(formatter)
+
+    log_queue: queue.Queue = queue.Queue(-1)
+    root = logging.getLogger()
+    root.setLevel(config.LOG_LEVEL)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+    listener = logging.handlers.QueueListener(
+        log_queue, file_handler, stream_handler, respect_handler_level=True,
+    )
+    listener.start()
+    return listener
+
 
 def main():
     """Validate environment and start the bot."""
@@ -25,7 +60,12 @@ def main():
         print("=" * 60)
         return
 
-    bot.run(config.DISCORD_TOKEN)
+    listener = _setup_logging()
+    try:
+        # Root logger is already configured — stop discord.py adding its own
+        bot.run(config.DISCORD_TOKEN, log_handler=None)
+    finally:
+        listener.stop()
 
 
 if __name__ == "__main__":
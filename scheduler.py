@@ -1,13 +1,25 @@
-"""Scheduled tasks that post cat content at fixed times each day."""
+"""Scheduled cat content posted at fixed times each day."""
 
+import asyncio
 import datetime
+import heapq
+import logging
+import time
+from dataclasses import dataclass
+
 import discord
-from discord.ext import tasks
 
 import config
+from memory.guild_settings import get as gs_get, get_all_overrides
 from services.cat_api import fetch_cat_gif, fetch_cat_fact
 from services.openai_chat import ask_cat
 
+log = logging.getLogger(__name__)
+
+# Bound once — these run on every slot lookup and post
+_utcnow = datetime.datetime.now
+_UTC = datetime.timezone.utc
+
 # ── Default greeting templates ───────────────────────────
 _SLOT_TEMPLATES = {
     "morning":   {"greeting": "Good Morning",   "emoji": "🌅",
@@ -18,112 +30,323 @@ _SLOT_TEMPLATES = {
                   "message": "Evening vibes! Curl up with this cozy cat content:"},
 }
 
+# Pre-rendered embed text and prompt, inherited by every slot built from a template
+for _tpl in _SLOT_TEMPLATES.values():
+    _tpl["title"] = f"{_tpl['emoji']}  {_tpl['greeting']}!  — Cat Supremacy"
+    _tpl["description"] = f"*{_tpl['message']}*"
+    _tpl["greeting_prompt"] = (
+        f"It's {_tpl['greeting'].lower()} time. Write a short, casual greeting "
+        f"to the server as a cat. Be cute and in character."
+    )
+
+
+@dataclass(frozen=True, slots=True)
+class Slot:
+    """One greeting slot of the daily schedule."""
+    greeting: str
+    emoji: str
+    message: str
+    title: str
+    description: str
+    greeting_prompt: str
+    color: int
+
+
+def _slot(name: str, color: int) -> Slot:
+    """Build the *name* slot from its template with the given embed color."""
+    return Slot(**_SLOT_TEMPLATES[name], color=color)
+
+
 # ── Module-level defaults (used by @cat now and @cat schedule) ──
 TIME_OF_DAY = {
-    config.MORNING_HOUR: {**_SLOT_TEMPLATES["morning"], "color": config.MORNING_COLOR},
-    config.AFTERNOON_HOUR: {**_SLOT_TEMPLATES["afternoon"], "color": config.AFTERNOON_COLOR},
-    config.EVENING_HOUR: {**_SLOT_TEMPLATES["evening"], "color": config.EVENING_COLOR},
+    config.MORNING_HOUR: _slot("morning", config.MORNING_COLOR),
+    config.AFTERNOON_HOUR: _slot("afternoon", config.AFTERNOON_COLOR),
+    config.EVENING_HOUR: _slot("evening", config.EVENING_COLOR),
 }
 
+# Guild settings that change the schedule map
+_SCHEDULE_SETTING_KEYS = (
+    "morning_hour", "afternoon_hour", "evening_hour",
+    "morning_color", "afternoon_color", "evening_color",
+)
+
 # ── Schedule times (UTC) ─────────────────────────────────
-SCHEDULE_TIMES = [
-    datetime.time(hour=config.MORNING_HOUR, tzinfo=datetime.timezone.utc),
-    datetime.time(hour=config.AFTERNOON_HOUR, tzinfo=datetime.timezone.utc),
-    datetime.time(hour=config.EVENING_HOUR, tzinfo=datetime.timezone.utc),
-]
+SCHEDULE_TIMES = tuple(
+    datetime.time(hour=hour, tzinfo=_UTC)
+    for hour in (config.MORNING_HOUR, config.AFTERNOON_HOUR, config.EVENING_HOUR)
+)
 
 
-def _build_time_of_day(guild_id: int | None = None) -> dict[int, dict]:
+def _build_time_of_day(guild_id: int | None = None) -> dict[int, Slot]:
     """Build a TIME_OF_DAY map using per-guild settings if available."""
     if guild_id is None:
         return TIME_OF_DAY
-    from memory.guild_settings import get as gs_get
+    overrides = get_all_overrides(guild_id)
+    if not any(key in overrides for key in _SCHEDULE_SETTING_KEYS):
+        # No schedule overrides — share the module-level map
+        return TIME_OF_DAY
     morning_h = gs_get(guild_id, "morning_hour")
     afternoon_h = gs_get(guild_id, "afternoon_hour")
     evening_h = gs_get(guild_id, "evening_hour")
     return {
-        morning_h:   {**_SLOT_TEMPLATES["morning"],   "color": gs_get(guild_id, "morning_color")},
-        afternoon_h: {**_SLOT_TEMPLATES["afternoon"], "color": gs_get(guild_id, "afternoon_color")},
-        evening_h:   {**_SLOT_TEMPLATES["evening"],   "color": gs_get(guild_id, "evening_color")},
+        morning_h:   _slot("morning",   gs_get(guild_id, "morning_color")),
+        afternoon_h: _slot("afternoon", gs_get(guild_id, "afternoon_color")),
+        evening_h:   _slot("evening",   gs_get(guild_id, "evening_color")),
     }
 
 
-def _current_slot(guild_id: int | None = None) -> dict:
+def _hour_table(tod: dict[int, Slot]) -> list[Slot]:
+    """Map every UTC hour 0-23 to the slot that has most recently started.
+
+    Hours before the earliest slot fall back to the first slot in *tod*.
+    """
+    current = next(iter(tod.values()))
+    table = []
+    for hour in range(24):
+        current = tod.get(hour, current)
+        table.append(current)
+    return table
+
+
+# Hour → slot lookup for the default schedule
+_HOUR_TO_SLOT = _hour_table(TIME_OF_DAY)
+
+# Lookups for guild schedules, keyed by their (hour, slot) pairs
+_guild_hour_tables: dict[tuple, list[Slot]] = {}
+
+
+def _hour_table_for(tod: dict[int, Slot]) -> list[Slot]:
+    """Return the hour table for *tod*, building it once per distinct schedule."""
+    if tod is TIME_OF_DAY:
+        return _HOUR_TO_SLOT
+    key = tuple(tod.items())
+    table = _guild_hour_tables.get(key)
+    if table is None:
+        table = _guild_hour_tables[key] = _hour_table(tod)
+    return table
+
+
+def _slot_at(hour: int, guild_id: int | None = None) -> Slot:
+    """Return the greeting slot a guild uses at UTC *hour*."""
+    return _hour_table_for(_build_time_of_day(guild_id))[hour]
+
+
+def _current_slot(guild_id: int | None = None) -> Slot:
     """Return the greeting slot for the current UTC hour."""
-    tod = _build_time_of_day(guild_id)
-    now_hour = datetime.datetime.now(datetime.timezone.utc).hour
-    print(f"[SCHED] Determining slot for UTC hour {now_hour}")
-    # Find the closest slot that has already started
-    for hour in sorted(tod.keys(), reverse=True):
-        if now_hour >= hour:
-            return tod[hour]
-    return list(tod.values())[0]
-
-
-async def _build_embed(slot: dict) -> tuple[discord.Embed, str]:
-    """Create a rich embed with a cat GIF and fact."""
-    print(f"[SCHED] Building embed for slot '{slot['greeting']}'")
-    gif_url = await fetch_cat_gif()
-    fact = await fetch_cat_fact()
-
-    embed = discord.Embed(
-        title=f"{slot['emoji']}  {slot['greeting']}!  — Cat Supremacy",
-        description=f"*{slot['message']}*",
-        color=slot["color"],
-        timestamp=datetime.datetime.now(datetime.timezone.utc),
-    )
-    embed.set_image(url=gif_url)
-    embed.add_field(name="🐱 Cat Fact", value=fact, inline=False)
-    embed.set_footer(text="Cat Supremacy Bot • Powered by TheCatAPI & catfact.ninja")
+    now_hour = _utcnow(_UTC).hour
+    log.debug("[SCHED] Determining slot for UTC hour %s", now_hour)
+    return _slot_at(now_hour, guild_id)
 
-    print(f"[SCHED] Embed built for '{slot['greeting']}'")
-    return embed, gif_url
 
+async def _within_deadline(aw, fallback, what: str):
+    """Await *aw*, returning *fallback* if it overruns SCHEDULE_FETCH_TIMEOUT."""
+    try:
+        return await asyncio.wait_for(aw, timeout=config.SCHEDULE_FETCH_TIMEOUT)
+    except asyncio.TimeoutError:
+        log.warning("[SCHED] %s timed out — using fallback", what)
+        return fallback
 
-async def _build_scheduled_messages(slot: dict) -> tuple[str, str, str]:
-    """Build the three separate messages for a scheduled post: greeting, fact, gif."""
-    print(f"[SCHED] Building scheduled messages for slot '{slot['greeting']}'")
-    greeting_prompt = (
-        f"It's {slot['greeting'].lower()} time. Write a short, casual greeting "
-        f"to the server as a cat. Be cute and in character."
+
+# Discord length limits
+_MESSAGE_LIMIT = 2000
+_FIELD_LIMIT = 1024
+
+# Slot-only parts of the embed, keyed by slot
+_SLOT_EMBEDS: dict[Slot, discord.Embed] = {}
+
+
+def _slot_embed(slot: Slot) -> discord.Embed:
+    """Return a fresh copy of the title/description/footer skeleton for *slot*."""
+    skeleton = _SLOT_EMBEDS.get(slot)
+    if skeleton is None:
+        skeleton = _SLOT_EMBEDS[slot] = discord.Embed(
+            title=slot.title,
+            description=slot.description,
+            color=slot.color,
+        )
+        skeleton.set_footer(text="Cat Supremacy Bot • Powered by TheCatAPI & catfact.ninja")
+    return skeleton.copy()
+
+
+for _default in TIME_OF_DAY.values():
+    _slot_embed(_default)
+
+
+@dataclass(frozen=True, slots=True)
+class CatPayload:
+    """Everything fetched for one post: the cat's greeting, a fact and a GIF."""
+    greeting: str
+    fact: str
+    gif_url: str
+
+
+async def _fetch_cat_payload(slot: Slot) -> CatPayload:
+    """Fetch the greeting, fact and GIF URL for a post in *slot*."""
+    log.debug("[SCHED] Fetching cat payload for slot '%s'", slot.greeting)
+    plain_greeting = f"{slot.emoji} {slot.greeting}!"
+    # Independent sources — fetch concurrently, each with its own deadline
+    greeting, fact, gif_url = await asyncio.gather(
+        _within_deadline(ask_cat(slot.greeting_prompt), plain_greeting, "Greeting"),
+        _within_deadline(fetch_cat_fact(), config.FALLBACK_CAT_FACT, "Cat fact"),
+        _within_deadline(fetch_cat_gif(), config.FALLBACK_CAT_GIF, "Cat GIF"),
     )
-    greeting = await ask_cat(greeting_prompt)
-    fact = await fetch_cat_fact()
-    gif_url = await fetch_cat_gif()
-    print(f"[SCHED] Scheduled messages built for '{slot['greeting']}'")
-    return greeting, f"🐱 {fact}", gif_url
+    if greeting.startswith("❌"):  # ask_cat failed — don't post the error
+        greeting = plain_greeting
+    log.debug("[SCHED] Cat payload fetched for '%s'", slot.greeting)
+    return CatPayload(greeting, fact, gif_url)
+
+
+# ── Prefetched post content ──────────────────────────────
+_PREFETCH_LEAD = 120.0          # seconds before a slot to start fetching
+_PREFETCH_MAX_AGE = 30 * 60.0   # older prefetches are fetched again
+_next_post_cache: dict[str, tuple[float, CatPayload]] = {}
+
+
+async def _prefetch_slot(slot: Slot) -> None:
+    """Fetch a post's content ahead of time into ``_next_post_cache``."""
+    try:
+        payload = await _fetch_cat_payload(slot)
+    except Exception as e:
+        log.warning("Prefetch for '%s' failed: %s", slot.greeting, e)
+        return
+    _next_post_cache[slot.greeting] = (time.monotonic(), payload)
+
+
+async def _post_content(slot: Slot) -> CatPayload:
+    """Return prefetched content for *slot* if fresh, else fetch it now.
+
+    Every guild posting *slot* shares the prefetched payload; the cache
+    is cleared once the slot has fired.
+    """
+    cached = _next_post_cache.get(slot.greeting)
+    if cached is not None and time.monotonic() - cached[0] < _PREFETCH_MAX_AGE:
+        return cached[1]
+    return await _fetch_cat_payload(slot)
 
 
-def setup_scheduled_tasks(bot: discord.Client):
-    """Register the daily cat posting loop on the bot."""
+def _render_post_embed(slot: Slot, payload: CatPayload) -> discord.Embed:
+    """Pack the fact and GIF into one embed so a post is a single message."""
+    embed = _slot_embed(slot)
+    embed.timestamp = _utcnow(_UTC)
+    embed.set_image(url=payload.gif_url)
+    embed.add_field(name="🐱 Cat Fact", value=payload.fact[:_FIELD_LIMIT], inline=False)
+    return embed
+
+
+_ONE_DAY = datetime.timedelta(days=1)
+
+
+def _schedule_heap(now: datetime.datetime) -> list[datetime.datetime]:
+    """Return a min-heap of the next fire time of every SCHEDULE_TIMES slot."""
+    heap = []
+    for slot_time in SCHEDULE_TIMES:
+        target = datetime.datetime.combine(now.date(), slot_time)
+        if target <= now:
+            target += _ONE_DAY
+        heap.append(target)
+    heapq.heapify(heap)
+    return heap
+
+
+class CatPoster:
+    """Posts cat content at every SCHEDULE_TIMES slot.
+
+    A single task keeps a min-heap of upcoming fire times and sleeps until
+    the earliest one instead of polling, so the bot does no work between
+    posts.  A slot that has already passed when it reaches the top of the
+    heap (a post overran) is skipped rather than fired in a catch-up burst.
+    """
+
+    def __init__(self, bot: discord.Client):
+        self.bot = bot
+        self._task: asyncio.Task | None = None
+
+    def start(self) -> None:
+        self._task = asyncio.create_task(self._run())
+
+    def is_running(self) -> bool:
+        return self._task is not None and not self._task.done()
+
+    def cancel(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+
+    async def _run(self) -> None:
+        await self.bot.wait_until_ready()
+        # Surface a bad default channel once, not on every post
+        if self.bot.get_channel(config.CAT_CHANNEL_ID) is None:
+            log.error(
+                "[SCHED] Default cat channel %s not found — guilds without "
+                "a cat_channel_id override will be skipped",
+                config.CAT_CHANNEL_ID,
+            )
+        log.info("[SCHED] Scheduled cat poster is ready!")
+        heap = _schedule_heap(_utcnow(_UTC))
+        while True:
+            now = _utcnow(_UTC)
+            # The earliest slot fires next; it goes back in for the same time tomorrow
+            target = heapq.heapreplace(heap, heap[0] + _ONE_DAY)
+            if target < now:
+                log.warning("[SCHED] Missed the %s UTC slot — skipping", target.strftime("%H:%M"))
+                continue
+            log.info("[SCHED] Next scheduled post at %s UTC", target.strftime("%Y-%m-%d %H:%M"))
+            lead = (target - now).total_seconds() - _PREFETCH_LEAD
+            if lead > 0:
+                await asyncio.sleep(lead)
+                now = _utcnow(_UTC)
+            # Fetch during the lead time so the post itself goes out at once
+            prefetch = asyncio.ensure_future(self._prefetch(target.hour))
+            try:
+                # Loop in case the sleep wakes a hair early
+                while now < target:
+                    await asyncio.sleep((target - now).total_seconds())
+                    now = _utcnow(_UTC)
+                await prefetch
+            finally:
+                prefetch.cancel()  # no-op once done; stops it if we're cancelled
+            try:
+                await self.post_cat_content()
+            except Exception as e:
+                log.error("Scheduled post failed: %s", e)
+            finally:
+                _next_post_cache.clear()  # this slot's content is spent
+
+    async def _prefetch(self, hour: int) -> None:
+        """Prefetch content for every distinct slot the guilds use at *hour*."""
+        slots = {}
+        for guild in self.bot.guilds:
+            slot = _slot_at(hour, guild.id)
+            slots.setdefault(slot.greeting, slot)
+        await asyncio.gather(*(_prefetch_slot(slot) for slot in slots.values()))
 
-    @tasks.loop(time=SCHEDULE_TIMES)
-    async def post_cat_content():
-        print("[SCHED] Scheduled post triggered")
+    async def post_cat_content(self) -> None:
+        log.info("[SCHED] Scheduled post triggered")
+        bot = self.bot
         # Resolve channel — check guild overrides for each guild the bot is in
-        from memory.guild_settings import get as gs_get
-        channels_posted = set()
+        channels_seen = set()
         for guild in bot.guilds:
             ch_id = gs_get(guild.id, "cat_channel_id")
-            if ch_id in channels_posted:
+            if ch_id in channels_seen:
                 continue
+            # Each channel is resolved (or reported missing) once per post
+            channels_seen.add(ch_id)
             channel = bot.get_channel(ch_id)
             if channel is None:
-                print(f"[WARNING] Channel {ch_id} not found for guild {guild.id}. Skipping.")
+                log.warning("Channel %s not found for guild %s. Skipping.", ch_id, guild.id)
                 continue
-            channels_posted.add(ch_id)
             slot = _current_slot(guild_id=guild.id)
-            greeting, fact, gif_url = await _build_scheduled_messages(slot)
-            await channel.send(greeting[:2000])
-            await channel.send(fact[:2000])
-            await channel.send(gif_url)
-            print(f"[SCHED] Posted {slot['greeting']} cat content to #{channel.name} (guild {guild.id})")
+            payload = await _post_content(slot)
+            # One request per channel instead of three
+            await channel.send(payload.greeting[:_MESSAGE_LIMIT], embed=_render_post_embed(slot, payload))
+            log.info(
+                "[SCHED] Posted %s cat content to #%s (guild %s)",
+                slot.greeting, channel.name, guild.id,
+            )
 
-    @post_cat_content.before_loop
-    async def before_post():
-        await bot.wait_until_ready()
-        print("[INFO] Scheduled cat poster is ready!")
 
+def setup_scheduled_tasks(bot: discord.Client) -> CatPoster:
+    """Create the daily cat poster for the bot (started from on_ready)."""
+    poster = CatPoster(bot)
     # Attach to bot so it can be started from on_ready
-    bot.cat_poster = post_cat_content
-    return post_cat_content
+    bot.cat_poster = poster
+    return poster
@@ -1,41 +1,190 @@
-"""TheCatAPI and catfact.ninja integrations."""
+"""TheCatAPI and catfact.ninja integrations.
+
+GIFs and facts are fetched in batches and kept in small in-process ring
+buffers, so most calls return a cached item without touching the network.
+A pool is refreshed after its TTL, or after the server's
+``Cache-Control: max-age`` if that is longer.  Fact pages are revalidated
+with ``If-None-Match`` / ``If-Modified-Since``, so an unchanged page
+costs a bodiless 304.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import random
+import time
+from collections import deque
+from typing import Awaitable, Callable, Optional
 
 import aiohttp
 
 import config
+from services.http_session import get_session
 
+log = logging.getLogger(__name__)
 
-async def fetch_cat_gif() -> str:
-    """Return a URL to a random cat GIF from The Cat API."""
-    print("[API] Fetching cat GIF from TheCatAPI...")
-    params = {"mime_types": "gif", "limit": 1}
+# ── Cache tunables ───────────────────────────────────────
+_CACHE_SIZE = 32       # max items kept per pool
+_PREFETCH_COUNT = 10   # items requested per API call
+
+# ── Cached pools, keyed by name ("gif" / "fact") ─────────
+_pools: dict[str, deque[str]] = {}
+_fetched_at: dict[str, float] = {}
+_ttls: dict[str, float] = {}     # raised to the server's max-age when it allows
+_fact_last_page: int = 1
+
+# Validators per facts page: page → (ETag, Last-Modified, facts)
+_fact_validators: dict[int, tuple[Optional[str], Optional[str], list[str]]] = {}
+
+# ── In-flight refreshes, keyed by pool name ──────────────
+_inflight: dict[str, asyncio.Future] = {}
+
+
+# ── Batch downloads ──────────────────────────────────────
+
+def _max_age(resp: aiohttp.ClientResponse) -> float:
+    """Return the ``Cache-Control: max-age`` of *resp* in seconds (0 if absent)."""
+    for directive in resp.headers.get("Cache-Control", "").split(","):
+        name, _, value = directive.strip().partition("=")
+        if name.lower() == "max-age":
+            try:
+                return float(value)
+            except ValueError:
+                return 0.0
+    return 0.0
+
+
+async def _download_gifs() -> tuple[list[str], float]:
+    """Fetch a batch of GIF URLs from The Cat API.
+
+    Returns ``(urls, max_age)`` — an empty list on failure.
+    """
+    log.debug("[API] Fetching %s cat GIFs from TheCatAPI...", _PREFETCH_COUNT)
+    params = {"mime_types": "gif", "limit": _PREFETCH_COUNT}
     headers = {}
     if config.CAT_API_KEY:
         headers["x-api-key"] = config.CAT_API_KEY
 
-    async with aiohttp.ClientSession() as session:
+    try:
+        session = await get_session()
         async with session.get(
             config.CAT_GIF_URL, params=params, headers=headers
         ) as resp:
             if resp.status == 200:
                 data = await resp.json()
-                if data:
-                    print(f"[API] Cat GIF fetched: {data[0]['url'][:80]}")
-                    return data[0]["url"]
-    # Fallback GIF if the API is unreachable
-    print("[API] Cat GIF API failed — using fallback GIF")
-    return "https://media.giphy.com/media/JIX9t2j0ZTN9S/giphy.gif"
+                urls = [item["url"] for item in data if item.get("url")]
+                log.debug("[API] Cat GIFs fetched: %s", len(urls))
+                return urls, _max_age(resp)
+            log.warning("[API] Cat GIF API returned HTTP %s", resp.status)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        log.warning("[API] Cat GIF request failed: %s", e)
+    return [], 0.0
 
 
-async def fetch_cat_fact() -> str:
-    """Return a random cat fact from catfact.ninja."""
-    print("[API] Fetching cat fact from catfact.ninja...")
-    async with aiohttp.ClientSession() as session:
-        async with session.get(config.CAT_FACT_URL) as resp:
+async def _download_facts() -> tuple[list[str], float]:
+    """Fetch a page of cat facts from catfact.ninja.
+
+    Returns ``(facts, max_age)`` — an empty list on failure.
+    """
+    global _fact_last_page
+    page = random.randint(1, _fact_last_page)
+    log.debug("[API] Fetching %s cat facts from catfact.ninja (page %s)...", _PREFETCH_COUNT, page)
+    params = {"limit": _PREFETCH_COUNT, "page": page}
+
+    # Revalidate a page we've seen before instead of re-downloading it
+    headers = {}
+    cached = _fact_validators.get(page)
+    if cached is not None:
+        etag, last_modified, _ = cached
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    try:
+        session = await get_session()
+        async with session.get(config.CAT_FACTS_URL, params=params, headers=headers) as resp:
+            if resp.status == 304 and cached is not None:
+                log.debug("[API] Cat facts page %s not modified — reusing cached copy", page)
+                return cached[2], _max_age(resp)
             if resp.status == 200:
                 data = await resp.json()
-                fact = data.get("fact", "Cats are amazing!")
-                print(f"[API] Cat fact fetched: '{fact[:60]}...'")
-                return fact
-    print("[API] Cat fact API failed — using fallback fact")
-    return "Cats sleep for about 70%% of their lives. 😴"
+                _fact_last_page = max(1, int(data.get("last_page", 1)))
+                facts = [item["fact"] for item in data.get("data", []) if item.get("fact")]
+                log.debug("[API] Cat facts fetched: %s", len(facts))
+                etag = resp.headers.get("ETag")
+                last_modified = resp.headers.get("Last-Modified")
+                if etag or last_modified:
+                    _fact_validators[page] = (etag, last_modified, facts)
+                return facts, _max_age(resp)
+            log.warning("[API] Cat fact API returned HTTP %s", resp.status)
+    except (aiohttp.ClientError, asyncio.TimeoutError, ValueError) as e:
+        log.warning("[API] Cat fact request failed: %s", e)
+    return [], 0.0
+
+
+# ── Pool refresh (single-flight) ─────────────────────────
+
+def _start_flight(key: str, factory) -> asyncio.Future:
+    """Return the in-flight task for *key*, starting ``factory()`` if idle."""
+    task = _inflight.get(key)
+    if task is None:
+        task = asyncio.ensure_future(factory())
+        _inflight[key] = task
+        task.add_done_callback(lambda _: _inflight.pop(key, None))
+    return task
+
+
+async def _single_flight(key: str, factory):
+    """Await *factory* — concurrent callers for *key* share one call."""
+    # Shield so one caller's cancellation doesn't abort the shared request
+    return await asyncio.shield(_start_flight(key, factory))
+
+
+def _fill(key: str, ttl: float, download) -> Callable[[], Awaitable[None]]:
+    """Return a coroutine factory that downloads a batch into pool *key*."""
+    async def fill() -> None:
+        items, max_age = await download()
+        if items:
+            _pools.setdefault(key, deque(maxlen=_CACHE_SIZE)).extend(items)
+            _fetched_at[key] = time.monotonic()
+            _ttls[key] = max(ttl, max_age)
+    return fill
+
+
+async def _cached(key: str, ttl: float, download) -> Optional[str]:
+    """Return a random item from pool *key*, refreshing it via *download*.
+
+    An empty pool is filled before returning; a pool older than *ttl*
+    is served as-is while a background refresh runs.  Returns ``None``
+    if the pool is still empty (API unreachable).
+    """
+    pool = _pools.get(key)
+    if not pool:
+        await _single_flight(key, _fill(key, ttl, download))
+        pool = _pools.get(key)
+    elif time.monotonic() - _fetched_at[key] > _ttls[key]:
+        _start_flight(key, _fill(key, ttl, download))  # refresh in background
+    return random.choice(pool) if pool else None
+
+
+# ── Public API ───────────────────────────────────────────
+
+async def fetch_cat_gif() -> str:
+    """Return a URL to a random cat GIF from The Cat API."""
+    url = await _cached("gif", config.CAT_GIF_TTL, _download_gifs)
+    if url is None:
+        # Fallback GIF if the API is unreachable
+        log.warning("[API] Cat GIF API failed — using fallback GIF")
+        return config.FALLBACK_CAT_GIF
+    return url
+
+
+async def fetch_cat_fact() -> str:
+    """Return a random cat fact from catfact.ninja."""
+    fact = await _cached("fact", config.CAT_FACT_TTL, _download_facts)
+    if fact is None:
+        log.warning("[API] Cat fact API failed — using fallback fact")
+        return config.FALLBACK_CAT_FACT
+    return fact
@@ -2,9 +2,13 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Optional
 
 import config
+from services.openai_client import get_openai_client, openai_limit
+
+log = logging.getLogger(__name__)
 
 
 async def generate_embedding(text: str) -> Optional[list[float]]:
@@ -14,33 +18,32 @@ async def generate_embedding(text: str) -> Optional[list[float]]:
     missing or the call fails.
     """
     if not config.OPENAI_API_KEY:
-        print("[EMBED] Skipped — no OpenAI API key configured")
+        log.debug("[EMBED] Skipped — no OpenAI API key configured")
         return None
 
     text = text[:2000].strip()
     if not text:
-        print("[EMBED] Skipped — empty text after trimming")
+        log.debug("[EMBED] Skipped — empty text after trimming")
         return None
 
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+    client = get_openai_client()
 
     try:
-        response = await client.embeddings.create(
-            model=config.EMBEDDING_MODEL,
-            input=text,
-            dimensions=config.EMBEDDING_DIMENSIONS,
-        )
+        async with openai_limit:
+            response = await client.embeddings.create(
+                model=config.EMBEDDING_MODEL,
+                input=text,
+                dimensions=config.EMBEDDING_DIMENSIONS,
+            )
         embedding = response.data[0].embedding
         usage = response.usage
-        print(
-            f"[EMBED] Generated embedding ({len(embedding)} dims) | "
-            f"tokens: {usage.total_tokens}"
+        log.debug(
+            "[EMBED] Generated embedding (%s dims) | tokens: %s",
+            len(embedding), usage.total_tokens,
         )
         return embedding
     except Exception as e:
-        print(f"[EMBED] Failed to generate embedding: {e}")
+        log.warning("[EMBED] Failed to generate embedding: %s", e)
         return None
 
 
@@ -52,32 +55,31 @@ async def generate_embeddings_batch(
     Returns a list of embedding vectors (or ``None`` for any that fail).
     """
     if not config.OPENAI_API_KEY:
-        print("[EMBED] Batch skipped — no OpenAI API key configured")
+        log.debug("[EMBED] Batch skipped — no OpenAI API key configured")
         return [None] * len(texts)
 
     cleaned = [t[:2000].strip() for t in texts]
     if not any(cleaned):
         return [None] * len(texts)
 
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+    client = get_openai_client()
 
     try:
-        response = await client.embeddings.create(
-            model=config.EMBEDDING_MODEL,
-            input=cleaned,
-            dimensions=config.EMBEDDING_DIMENSIONS,
-        )
+        async with openai_limit:
+            response = await client.embeddings.create(
+                model=config.EMBEDDING_MODEL,
+                input=cleaned,
+                dimensions=config.EMBEDDING_DIMENSIONS,
+            )
         results: list[Optional[list[float]]] = [None] * len(texts)
         for item in response.data:
             results[item.index] = item.embedding
         usage = response.usage
-        print(
-            f"[EMBED] Batch generated {len(response.data)} embeddings | "
-            f"tokens: {usage.total_tokens}"
+        log.debug(
+            "[EMBED] Batch generated %s embeddings | tokens: %s",
+            len(response.data), usage.total_tokens,
         )
         return results
     except Exception as e:
-        print(f"[EMBED] Batch embedding failed: {e}")
+        log.warning("[EMBED] Batch embedding failed: %s", e)
         return [None] * len(texts)
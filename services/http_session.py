@@ -0,0 +1,44 @@
+"""Shared aiohttp session for every outbound HTTP call.
+
+One connector means one DNS cache and one keep-alive pool across the cat
+APIs, attachment downloads, and image fetches.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import aiohttp
+
+_session: Optional[aiohttp.ClientSession] = None
+
+# Upper bound per request so a stalled API can't hang a command or post
+_TIMEOUT = aiohttp.ClientTimeout(total=10)
+
+
+async def get_session() -> aiohttp.ClientSession:
+    """Return the shared ``ClientSession``, creating it on first use."""
+    global _session
+    if _session is None or _session.closed:
+        _session = aiohttp.ClientSession(
+            # Few hosts, bursty traffic: a small pool, cached DNS, and
+            # aiohttp's default HTTP/1.1 keep-alive
+            connector=aiohttp.TCPConnector(
+                limit=20,
+                limit_per_host=8,
+                use_dns_cache=True,
+                ttl_dns_cache=600,
+                keepalive_timeout=75,
+                enable_cleanup_closed=True,
+            ),
+            timeout=_TIMEOUT,
+        )
+    return _session
+
+
+async def close_session() -> None:
+    """Close the shared session (call once on shutdown)."""
+    global _session
+    if _session is not None and not _session.closed:
+        await _session.close()
+    _session = None
@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
+import logging
 from typing import Optional
 
 import config
+from memory.guild_settings import get as gs_get
 from memory.prompt_builder import build_system_prompt, build_messages
+from services.openai_client import get_openai_client, openai_limit
+
+log = logging.getLogger(__name__)
 
 # ── Cat personality (base system prompt) ─────────────────
 CAT_SYSTEM_PROMPT = (
@@ -19,6 +24,9 @@ CAT_SYSTEM_PROMPT = (
     "You have opinions and you're not afraid to share them."
 )
 
+# Reply when no answer could be produced (callers skip ``❌`` replies)
+_NO_ANSWER = "❌ Couldn't get an answer"
+
 
 async def ask_cat(
     question: str,
@@ -51,13 +59,10 @@ async def ask_cat(
     if not config.OPENAI_API_KEY:
         return "❌ OpenAI API key is not configured. Set `OPENAI_API_KEY` in your `.env` file."
 
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+    client = get_openai_client()
 
     # Use per-guild personality if set, else default
     if guild_id:
-        from memory.guild_settings import get as gs_get
         personality = gs_get(guild_id, "cat_personality")
     else:
         personality = CAT_SYSTEM_PROMPT
@@ -68,6 +73,13 @@ async def ask_cat(
         custom_context=custom_context,
     )
 
+    if recent_messages:
+        # History only needs the gist — long turns inflate prompt tokens
+        recent_messages = [
+            {"role": m["role"], "content": m["content"][:config.CHAT_HISTORY_CHARS]}
+            for m in recent_messages
+        ]
+
     messages = build_messages(
         system_prompt=system_content,
         user_message=question,
@@ -81,22 +93,46 @@ async def ask_cat(
     else:
         model = config.CHAT_MODEL
     has_images = attachments and any(a["type"] == "image" for a in attachments)
-    print(f"[API] ask_cat using model={model} | detail={image_detail if has_images else 'n/a'}")
+    log.debug(
+        "[API] ask_cat using model=%s | detail=%s",
+        model, image_detail if has_images else 'n/a',
+    )
 
     try:
-        response = await client.chat.completions.create(
-            model=model,
-            messages=messages,
-            max_completion_tokens=10240,
-            temperature=1,
-        )
-        answer = response.choices[0].message.content
-        usage = response.usage
-        print(
-            f"[API] ask_cat response received ({len(answer)} chars) | "
-            f"tokens: prompt={usage.prompt_tokens}, completion={usage.completion_tokens}, total={usage.total_tokens}"
-        )
+        # Stream the reply and join the deltas — tokens are consumed as they
+        # are decoded rather than held in one final response object.
+        parts: list[str] = []
+        usage = None
+        finish_reason = None
+        async with openai_limit:
+            stream = await client.chat.completions.create(
+                model=model,
+                messages=messages,
+                max_completion_tokens=config.CHAT_MAX_COMPLETION_TOKENS,
+                temperature=1,
+                stream=True,
+                stream_options={"include_usage": True},
+            )
+            async for chunk in stream:
+                if chunk.choices:
+                    choice = chunk.choices[0]
+                    if choice.delta.content:
+                        parts.append(choice.delta.content)
+                    if choice.finish_reason:
+                        finish_reason = choice.finish_reason
+                if chunk.usage is not None:  # final chunk (include_usage)
+                    usage = chunk.usage
+        answer = "".join(parts)
+        if not answer:
+            # Filtered, all reasoning, or cut off before any text
+            log.warning("ask_cat got an empty reply (finish_reason=%s)", finish_reason)
+            return _NO_ANSWER
+        if usage is not None:
+            log.debug(
+                "[API] ask_cat response received (%s chars) | tokens: prompt=%s, completion=%s, total=%s",
+                len(answer), usage.prompt_tokens, usage.completion_tokens, usage.total_tokens,
+            )
         return answer
     except Exception as e:
-        print(f"[ERROR] ask_cat failed: {e}")
-        return f"❌ Couldn't get an answer: {e}"
+        log.error("ask_cat failed: %s", e)
+        return f"{_NO_ANSWER}: {e}"
@@ -0,0 +1,44 @@
+"""Shared ``AsyncOpenAI`` client for every OpenAI call.
+
+One client means one underlying HTTP connection pool, so chat, search,
+image, embedding and extraction requests reuse warm TLS connections
+instead of handshaking on every call.  Wrap each request in
+``async with openai_limit:`` to bound concurrency.
+"""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Optional
+
+from openai import AsyncOpenAI
+
+import config
+
+_client: Optional[AsyncOpenAI] = None
+
+# Caps in-flight OpenAI requests so bursts queue here instead of
+# tripping rate limits and the SDK's backoff retries
+openai_limit = asyncio.Semaphore(config.OPENAI_MAX_CONCURRENCY)
+
+
+def get_openai_client() -> AsyncOpenAI:
+    """Return the shared client, creating it on first use.
+
+    Callers check ``config.OPENAI_API_KEY`` first; this raises
+    ``RuntimeError`` if it is still missing.
+    """
+    global _client
+    if _client is None:
+        if not config.OPENAI_API_KEY:
+            raise RuntimeError("OPENAI_API_KEY is not configured")
+        _client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+    return _client
+
+
+async def close_openai_client() -> None:
+    """Close the shared client (call once on shutdown)."""
+    global _client
+    if _client is not None:
+        await _client.close()
+    _client = None
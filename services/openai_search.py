@@ -1,35 +1,39 @@
 """OpenAI web-search integration."""
 
+import logging
+
 import config
+from services.openai_client import get_openai_client, openai_limit
+
+log = logging.getLogger(__name__)
 
 
 async def search_web(query: str) -> str:
     """Search the web using OpenAI's web search and return a summarized answer."""
-    print(f"[API] search_web called | query='{query[:80]}'")
+    log.debug("[API] search_web called | query='%s'", query[:80])
     if not config.OPENAI_API_KEY:
-        print("[API] search_web aborted — no OpenAI API key")
+        log.debug("[API] search_web aborted — no OpenAI API key")
         return "❌ OpenAI API key is not configured. Set `OPENAI_API_KEY` in your `.env` file."
 
-    from openai import AsyncOpenAI
-
-    client = AsyncOpenAI(api_key=config.OPENAI_API_KEY)
+    client = get_openai_client()
 
     try:
-        response = await client.responses.create(
-            model="gpt-4.1-mini",
-            tools=[{"type": "web_search_preview"}],
-            input=(
-                f"Search the internet for the following topic and provide a concise summary "
-                f"with key findings and source links. Focus on news articles, journals, and "
-                f"reliable sources. Topic: {query}"
-            ),
-        )
+        async with openai_limit:
+            response = await client.responses.create(
+                model="gpt-4.1-mini",
+                tools=[{"type": "web_search_preview"}],
+                input=(
+                    f"Search the internet for the following topic and provide a concise summary "
+                    f"with key findings and source links. Focus on news articles, journals, and "
+                    f"reliable sources. Topic: {query}"
+                ),
+            )
         usage = response.usage
-        print(
-            f"[API] search_web response received ({len(response.output_text)} chars) | "
-            f"tokens: input={usage.input_tokens}, output={usage.output_tokens}, total={usage.total_tokens}"
+        log.debug(
+            "[API] search_web response received (%s chars) | tokens: input=%s, output=%s, total=%s",
+            len(response.output_text), usage.input_tokens, usage.output_tokens, usage.total_tokens,
         )
         return response.output_text
     except Exception as e:
-        print(f"[ERROR] search_web failed: {e}")
+        log.error("search_web failed: %s", e)
         return f"❌ Search failed: {e}"
@@ -1,5 +1,9 @@
 """PDF text extraction using PyMuPDF."""
 
+import logging
+
+log = logging.getLogger(__name__)
+
 
 def extract_pdf_text(pdf_bytes: bytes, max_chars: int = 8000) -> str:
     """Extract text from a PDF byte stream using PyMuPDF.
@@ -27,6 +31,6 @@ def extract_pdf_text(pdf_bytes: bytes, max_chars: int = 8000) -> str:
                 text_parts.append(chunk)
                 total += len(chunk)
     except Exception as e:
-        print(f"[PDF] Failed to extract text: {e}")
+        log.warning("[PDF] Failed to extract text: %s", e)
         return ""
     return "\n".join(text_parts)
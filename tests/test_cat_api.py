@@ -0,0 +1,34 @@
+"""Tests for the cached Cat API fetchers."""
+
+import asyncio
+
+import config
+from services import cat_api
+
+
+class _Response:
+    status = 200
+    headers = {}
+
+    async def json(self):
+        raise ValueError("not JSON")
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, *exc):
+        return False
+
+
+class _Session:
+    def get(self, url, **kwargs):
+        return _Response()
+
+
+def test_malformed_gif_response_falls_back(monkeypatch):
+    async def get_session():
+        return _Session()
+
+    monkeypatch.setattr(cat_api, "get_session", get_session)
+    monkeypatch.setattr(cat_api, "_pools", {})
+    assert asyncio.run(cat_api.fetch_cat_gif()) == config.FALLBACK_CAT_GIF
@@ -0,0 +1,28 @@
+"""Tests for custom context persistence."""
+
+from collections import OrderedDict
+
+import msgpack
+
+import config
+from memory import custom_contexts
+
+
+def test_failed_write_keeps_changes_dirty(monkeypatch, tmp_path):
+    monkeypatch.setattr(custom_contexts, "_contexts", OrderedDict())
+    monkeypatch.setattr(custom_contexts, "_dirty", False)
+    # A regular file where the data directory should be — the write must fail
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    monkeypatch.setattr(config, "CONTEXTS_FILE", str(blocker / "contexts.msgpack"))
+
+    custom_contexts.set_context(1, "cats rule")
+    assert custom_contexts.flush() is False
+    assert custom_contexts._dirty is True
+
+    # Once the disk is writable again the pending change is saved
+    path = tmp_path / "contexts.msgpack"
+    monkeypatch.setattr(config, "CONTEXTS_FILE", str(path))
+    assert custom_contexts.flush() is True
+    assert custom_contexts._dirty is False
+    assert msgpack.unpackb(path.read_bytes(), strict_map_key=False) == {1: "cats rule"}
@@ -0,0 +1,64 @@
+"""Tests for the memory evaluation pre-filter."""
+
+import asyncio
+from collections import OrderedDict
+from types import SimpleNamespace
+
+import config
+from memory import evaluator
+
+MESSAGE = "I'm building an ESP32 hydroponic garden this month"
+
+
+def _response(content):
+    return SimpleNamespace(
+        choices=[SimpleNamespace(message=SimpleNamespace(content=content))],
+        usage=SimpleNamespace(prompt_tokens=1, completion_tokens=1, total_tokens=2),
+    )
+
+
+def _setup(monkeypatch, results):
+    calls = []
+
+    async def create(**kwargs):
+        calls.append(kwargs)
+        result = results.pop(0)
+        if isinstance(result, Exception):
+            raise result
+        return result
+
+    async def search_memories(*args, **kwargs):
+        return []
+
+    client = SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+    monkeypatch.setattr(config, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(evaluator, "get_openai_client", lambda: client)
+    monkeypatch.setattr(evaluator, "search_memories", search_memories)
+    monkeypatch.setattr(evaluator, "_last_evaluated", OrderedDict())
+    return calls
+
+
+def _evaluate():
+    return asyncio.run(evaluator.evaluate_and_store_memories(1, "user", MESSAGE, "mrrp"))
+
+
+def test_failed_extraction_is_retried(monkeypatch):
+    calls = _setup(monkeypatch, [TimeoutError("slow"), _response("NONE")])
+    _evaluate()
+    _evaluate()  # same message — the first attempt never completed
+    assert len(calls) == 2
+
+
+def test_repeated_message_skipped_after_success(monkeypatch):
+    calls = _setup(monkeypatch, [_response("NONE")])
+    _evaluate()
+    _evaluate()
+    assert len(calls) == 1
+
+
+def test_tracked_users_are_bounded(monkeypatch):
+    monkeypatch.setattr(evaluator, "_last_evaluated", OrderedDict())
+    monkeypatch.setattr(evaluator, "_MAX_TRACKED_USERS", 2)
+    for user_id in range(3):
+        evaluator._mark_evaluated(user_id, MESSAGE)
+    assert list(evaluator._last_evaluated) == [1, 2]
@@ -0,0 +1,52 @@
+"""Tests for the streamed chat completion in ``ask_cat``."""
+
+import asyncio
+from types import SimpleNamespace
+
+import config
+from services import openai_chat
+
+
+def _chunk(content=None, finish_reason=None):
+    delta = SimpleNamespace(content=content)
+    return SimpleNamespace(
+        choices=[SimpleNamespace(delta=delta, finish_reason=finish_reason)],
+        usage=None,
+    )
+
+
+class _Stream:
+    def __init__(self, chunks):
+        self._chunks = iter(chunks)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        try:
+            return next(self._chunks)
+        except StopIteration:
+            raise StopAsyncIteration from None
+
+
+def _client(chunks):
+    async def create(**kwargs):
+        return _Stream(chunks)
+    return SimpleNamespace(chat=SimpleNamespace(completions=SimpleNamespace(create=create)))
+
+
+def _ask(monkeypatch, chunks):
+    monkeypatch.setattr(config, "OPENAI_API_KEY", "test-key")
+    monkeypatch.setattr(openai_chat, "get_openai_client", lambda: _client(chunks))
+    return asyncio.run(openai_chat.ask_cat("hello"))
+
+
+def test_deltas_are_joined(monkeypatch):
+    chunks = [_chunk("mrrp "), _chunk("meow"), _chunk(finish_reason="stop")]
+    assert _ask(monkeypatch, chunks) == "mrrp meow"
+
+
+def test_empty_stream_returns_failure_reply(monkeypatch):
+    answer = _ask(monkeypatch, [_chunk(finish_reason="length")])
+    assert answer
+    assert answer.startswith("❌")
@@ -0,0 +1,58 @@
+"""Tests for the scheduled poster's prefetch path."""
+
+import asyncio
+import datetime
+
+import scheduler
+
+
+class _Channel:
+    def __init__(self, name):
+        self.name = name
+        self.sent = []
+
+    async def send(self, content, *, embed=None):
+        self.sent.append((content, embed))
+
+
+class _Guild:
+    def __init__(self, guild_id):
+        self.id = guild_id
+
+
+class _Bot:
+    def __init__(self, channels):
+        self.channels = channels
+        self.guilds = [_Guild(guild_id) for guild_id in channels]
+
+    def get_channel(self, channel_id):
+        return self.channels.get(channel_id)
+
+
+def test_prefetched_payload_is_shared_by_every_guild(monkeypatch):
+    fetches = []
+
+    async def fake_fetch(slot):
+        fetches.append(slot.greeting)
+        return scheduler.CatPayload(f"greeting {len(fetches)}", "fact", "https://example.com/cat.gif")
+
+    now = datetime.datetime(2026, 1, 1, 12, tzinfo=scheduler._UTC)
+    monkeypatch.setattr(scheduler, "_utcnow", lambda tz: now)
+    monkeypatch.setattr(scheduler, "_fetch_cat_payload", fake_fetch)
+    monkeypatch.setattr(scheduler, "get_all_overrides", lambda guild_id: {})
+    # Each guild posts to its own channel, named after the guild ID
+    monkeypatch.setattr(scheduler, "gs_get", lambda guild_id, key: guild_id)
+    monkeypatch.setattr(scheduler, "_next_post_cache", {})
+
+    channels = {1: _Channel("one"), 2: _Channel("two")}
+    poster = scheduler.CatPoster(_Bot(channels))
+
+    async def fire():
+        await poster._prefetch(now.hour)
+        await poster.post_cat_content()
+
+    asyncio.run(fire())
+
+    assert fetches == [scheduler._current_slot().greeting]
+    assert [content for content, _ in channels[1].sent] == ["greeting 1"]
+    assert [content for content, _ in channels[2].sent] == ["greeting 1"]